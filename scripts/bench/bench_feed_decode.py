@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Compare full FeedMessage parsing against selective decoding on saved feeds.
+
+Replays examples/raw_feed_*.json|pb (latest capture per feed) without network and
+times parse + station scan for a few watched-station sets.
+
+Usage:
+  ./scripts/bench/bench_feed_decode.py [--repeat 20] [--stations B10 A27 ...]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+import app  # noqa: E402
+from mta_pi_led.services.feed_captures import load_latest_captures  # noqa: E402
+from mta_pi_led.services.feed_header import read_feed_header_timestamp  # noqa: E402
+
+DEFAULT_STATION_SETS = [["B10"], ["A27"], ["127"], ["A27", "R16"]]
+
+
+def time_ms(func: Callable[[], object], repeat: int) -> float:
+    samples: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def scan(feed, plan: app.WatchPlan, current_time: int):
+    route_times, _ = app._scan_feed_route_times(feed, current_time, plan)
+    return route_times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--stations", nargs="+", help="Single station set to benchmark")
+    args = parser.parse_args()
+
+    feeds = load_latest_captures()
+    station_sets = [args.stations] if args.stations else DEFAULT_STATION_SETS
+
+    print(f"{'stations':<20} {'feed':<8} {'full ms':>9} {'select ms':>10} {'speedup':>8}")
+    for station_ids in station_sets:
+        plan = app.build_watch_plan(station_ids)
+        if plan.stop_pattern is None:
+            print(
+                f"{','.join(station_ids)}: more than {app.SELECTIVE_DECODE_MAX_STOPS} "
+                "watched stops; selective decode disabled for this plan"
+            )
+            continue
+
+        for feed_key in plan.feed_keys:
+            content = feeds.get(feed_key)
+            if content is None:
+                continue
+            current_time = read_feed_header_timestamp(content) or int(time.time())
+
+            full = lambda: scan(app._parse_feed(content), plan, current_time)  # noqa: E731
+            selective = lambda: scan(  # noqa: E731
+                app.decode_feed_selectively(content, plan.stop_pattern, plan.route_targets),
+                plan,
+                current_time,
+            )
+            if full() != selective():
+                raise SystemExit(f"✗ Selective decode mismatch for {feed_key}")
+
+            full_ms = time_ms(full, args.repeat)
+            selective_ms = time_ms(selective, args.repeat)
+            print(
+                f"{','.join(station_ids):<20} {feed_key:<8} {full_ms:>9.2f} "
+                f"{selective_ms:>10.2f} {full_ms / selective_ms:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""Benchmark the batch arrivals pipeline on captured feeds, without network.
+
+Replays the newest examples/raw_feed_*.json / *.pb capture per feed through the
+same stages get_train_status_batch runs, with the feed scan cache bypassed, for
+watch plans of 1, 10 and all stations, and reports:
+  - parse ms:  feed decode (selective for single-station plans, else full)
+  - merge ms:  station scan + merge into route_times_by_station
+  - format ms: format_station_trains for every station (one minutes pass)
+  - peak KiB / blocks: tracemalloc peak and net new memory blocks for one pass
+
+The protobuf runtime (upb) decodes lazily and allocates in its own C arena, so
+part of a full parse shows up under merge and is invisible to tracemalloc.
+
+Usage:
+  ./scripts/bench/bench_pipeline.py [--repeat 10] [--counts 1 10 all]
+  ./scripts/bench/bench_pipeline.py --output bench.json
+  ./scripts/bench/bench_pipeline.py --baseline bench.json --tolerance 0.25
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+import app  # noqa: E402
+from mta_pi_led.services.feed_captures import load_latest_captures  # noqa: E402
+from mta_pi_led.services.feed_header import read_feed_header_timestamp  # noqa: E402
+from station_data import load_station_data  # noqa: E402
+
+TIMED_STAGES = ("parse_ms", "merge_ms", "format_ms")
+
+
+def select_station_ids(count: str) -> List[str]:
+    station_ids = list(load_station_data())
+    if count == "all":
+        return station_ids
+    return station_ids[: int(count)]
+
+
+def run_pipeline(
+    plan: app.WatchPlan,
+    feeds: Dict[str, bytes],
+    current_time: int,
+    timings: Dict[str, float],
+) -> Dict[str, Any]:
+    """One pass of decode → scan/merge → format, accumulating stage times."""
+    route_times_by_station = app._initialize_route_times_by_station(plan.station_routes)
+    for feed_key in plan.feed_keys:
+        content = feeds.get(feed_key)
+        if content is None:
+            continue
+
+        start = time.perf_counter()
+        if plan.stop_pattern is not None:
+            feed = app.decode_feed_selectively(content, plan.stop_pattern, plan.route_targets)
+        else:
+            feed = app._parse_feed(content)
+        parsed = time.perf_counter()
+
+        feed_route_times, _ = app._scan_feed_route_times(feed, current_time, plan)
+        app._merge_feed_route_times(
+            route_times_by_station,
+            feed_route_times,
+            current_time,
+            plan.arrivals_per_direction,
+        )
+        merged = time.perf_counter()
+        timings["parse_ms"] += (parsed - start) * 1000
+        timings["merge_ms"] += (merged - parsed) * 1000
+
+    start = time.perf_counter()
+    payloads = app.format_station_trains(
+        route_times_by_station,
+        plan.station_ids,
+        current_time,
+        plan.arrivals_per_direction,
+    )
+    timings["format_ms"] += (time.perf_counter() - start) * 1000
+    return payloads
+
+
+def measure_memory(run: Callable[[], Any]) -> Dict[str, float]:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    run()
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    allocated_blocks = sum(
+        stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0
+    )
+    return {"peak_kib": peak / 1024, "blocks": float(allocated_blocks)}
+
+
+def benchmark(count: str, feeds: Dict[str, bytes], repeat: int) -> Dict[str, float]:
+    plan = app.build_watch_plan(select_station_ids(count))
+    current_time = min(
+        read_feed_header_timestamp(feeds[feed_key]) or int(time.time())
+        for feed_key in plan.feed_keys
+        if feed_key in feeds
+    )
+
+    samples: Dict[str, List[float]] = {stage: [] for stage in TIMED_STAGES}
+    for _ in range(repeat):
+        timings = {stage: 0.0 for stage in TIMED_STAGES}
+        run_pipeline(plan, feeds, current_time, timings)
+        for stage in TIMED_STAGES:
+            samples[stage].append(timings[stage])
+
+    result = {stage: statistics.median(values) for stage, values in samples.items()}
+    result.update(
+        measure_memory(
+            lambda: run_pipeline(
+                plan,
+                feeds,
+                current_time,
+                {stage: 0.0 for stage in TIMED_STAGES},
+            )
+        )
+    )
+    result["stations"] = float(len(plan.station_ids))
+    return result
+
+
+def compare_to_baseline(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float,
+) -> List[str]:
+    regressions: List[str] = []
+    for count, metrics in results.items():
+        previous = baseline.get(count)
+        if previous is None:
+            continue
+        for metric in (*TIMED_STAGES, "peak_kib"):
+            old_value = previous.get(metric)
+            if not old_value:
+                continue
+            if metrics[metric] > old_value * (1 + tolerance):
+                regressions.append(
+                    f"{count} stations {metric}: {old_value:.2f} → {metrics[metric]:.2f}"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--counts", nargs="+", default=["1", "10", "all"])
+    parser.add_argument("--captures-dir", help="Directory with raw_feed_* captures")
+    parser.add_argument("--output", help="Write results JSON to this path")
+    parser.add_argument("--baseline", help="Fail if slower than this results JSON")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    feeds = load_latest_captures(args.captures_dir)
+    if not feeds:
+        raise SystemExit("✗ No raw_feed_* captures found")
+
+    results: Dict[str, Dict[str, float]] = {}
+    print(
+        f"{'stations':>8} {'parse ms':>9} {'merge ms':>9} {'format ms':>10} "
+        f"{'peak KiB':>9} {'blocks':>8}"
+    )
+    for count in args.counts:
+        result = benchmark(count, feeds, args.repeat)
+        results[count] = result
+        print(
+            f"{int(result['stations']):>8} {result['parse_ms']:>9.2f} "
+            f"{result['merge_ms']:>9.2f} {result['format_ms']:>10.2f} "
+            f"{result['peak_kib']:>9.0f} {int(result['blocks']):>8}"
+        )
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        print(f"✓ Results saved to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare_to_baseline(results, baseline, args.tolerance)
+        if regressions:
+            print("✗ Regressions beyond tolerance:")
+            for line in regressions:
+                print(f"  {line}")
+            raise SystemExit(1)
+        print(f"✓ Within {args.tolerance:.0%} of baseline")
+
+
+if __name__ == "__main__":
+    main()
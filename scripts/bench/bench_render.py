@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""Benchmark LED view rendering: per-pixel redraws vs the board's region renderer.
+
+The scene is the board's layout (route icon, station name, direction labels,
+six time boxes, bike icons and counters) placed as RegionRenderer regions with
+the same BDF text tiles the board uses. Each scenario presents one frame per
+iteration onto a pair of swapped canvases, like the matrix double buffer:
+  - pixel:     the previous implementation, every box cleared and both icons
+               drawn with one SetPixel per pixel
+  - full:      a whole-view redraw (e.g. rotation), one cached-frame SetImage
+  - countdown: one time box changes
+  - scroll:    the station name moves one pixel
+  - idle:      nothing changed
+
+Each line also shows the tile and frame cache hit rates during the timed frames.
+
+By default the canvases are Pillow images standing in for the matrix, so the
+numbers show Python-side call overhead; pass --matrix on the Pi (as root,
+board stopped) to draw on a real rgbmatrix canvas.
+
+Usage:
+  ./scripts/bench/bench_render.py [--frames 2000] [--matrix]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from PIL import Image  # noqa: E402
+
+from mta_pi_led.services.bdf_font import BdfFont  # noqa: E402
+from mta_pi_led.services.board_layout import (  # noqa: E402
+    BIKE_ICON,
+    EBIKE_ICON,
+    PANEL_SIZE,
+    Colors,
+    Layout,
+    render_name_strip,
+    render_text_tile,
+    text_box,
+)
+from mta_pi_led.services.frame_cache import FrameCache  # noqa: E402
+from mta_pi_led.services.raster import Bitmap  # noqa: E402
+from mta_pi_led.services.region_renderer import RegionRenderer  # noqa: E402
+
+FONT_PATH = PROJECT_ROOT / "fonts" / "4x6.bdf"
+ROUTE_ICON_PATH = PROJECT_ROOT / "icons" / "F.png"
+STATION_NAME = "Lexington Av/63 St"
+STATION_NAME_VISIBLE_CHARS = 5
+UPTOWN_TIMES = ("2m", "9m", "14m")
+DOWNTOWN_TIMES = ("4m", "11m", "20m")
+Area = Tuple[Tuple[int, int], Tuple[int, int]]
+
+
+class PillowCanvas:
+    """In-memory stand-in for an rgbmatrix FrameCanvas."""
+
+    def __init__(self):
+        self.image = Image.new("RGB", PANEL_SIZE)
+        self._pixels = self.image.load()
+
+    def SetPixel(self, x, y, r, g, b):  # noqa: N802 - rgbmatrix API
+        self._pixels[x, y] = (r, g, b)
+
+    def SetImage(self, image, offset_x=0, offset_y=0, unsafe=True):  # noqa: N802
+        self.image.paste(image, (offset_x, offset_y))
+
+
+class SwapChain:
+    """Two canvases presented alternately, like ``SwapOnVSync``."""
+
+    def __init__(self, canvases: List):
+        self.canvases = canvases
+        self.index = 0
+
+    @property
+    def back(self):
+        return self.canvases[self.index]
+
+    def swap(self):
+        self.index = 1 - self.index
+
+
+class BoardScene:
+    """The board's regions, with setters for the parts that change per frame."""
+
+    def __init__(self, font: BdfFont):
+        self.font = font
+        self.regions = RegionRenderer(
+            PANEL_SIZE,
+            tile_cache=FrameCache(256),
+            frame_cache=FrameCache(128),
+        )
+        visible_width = STATION_NAME_VISIBLE_CHARS * Layout.CHAR_WIDTH
+        self.strip, self.period = render_name_strip(font, STATION_NAME, visible_width, 3 * Layout.CHAR_WIDTH)
+        self._place_static()
+        self.set_station_offset(0)
+        self.set_times("uptown", UPTOWN_TIMES, Colors.GREEN)
+        self.set_times("downtown", DOWNTOWN_TIMES, Colors.YELLOW)
+
+    def _set_text(self, name: str, text: str, position: Tuple[int, int], width: int, color):
+        box = text_box(position, width)
+        self.regions.set_region(
+            name, box, (text, color), lambda: render_text_tile(self.font, box, position, color, text)
+        )
+
+    def _set_bitmap(self, name: str, bitmap: Bitmap, position: Tuple[int, int], color):
+        self.regions.set_region(name, position + bitmap.size, color, lambda: bitmap.tile(color))
+
+    def _place_static(self):
+        icon = Image.new("RGB", Layout.ICON_SIZE, Colors.DAZZLING_BLUE)
+        if ROUTE_ICON_PATH.exists():
+            icon = Image.open(ROUTE_ICON_PATH).convert("RGB").resize(Layout.ICON_SIZE)
+        self.regions.set_region("icon", Layout.ICON_POSITION + Layout.ICON_SIZE, "F", lambda: icon)
+        for name, label, position in (
+            ("uptown_label", "UPTOWN", Layout.UPTOWN_LABEL_POSITION),
+            ("downtown_label", "DOWNTOWN", Layout.DOWNTOWN_LABEL_POSITION),
+        ):
+            self._set_text(name, label, position, PANEL_SIZE[0] - position[0], Colors.WHITE)
+        self._set_bitmap("bike_icon", BIKE_ICON, Layout.BIKE_ICON_POSITION, Colors.DAZZLING_BLUE)
+        self._set_bitmap("ebike_icon", EBIKE_ICON, Layout.EBIKE_ICON_POSITION, Colors.DAZZLING_BLUE)
+        for name, count, position in (
+            ("bike_count", "7", (Layout.BIKE_ICON_POSITION[0] + 11, Layout.BIKE_ICON_POSITION[1] + 6)),
+            ("ebike_count", "2", (Layout.EBIKE_ICON_POSITION[0] + 5, Layout.EBIKE_ICON_POSITION[1] + 6)),
+        ):
+            self._set_text(name, count, position, Layout.CHAR_WIDTH * 2, Colors.BLUE)
+
+    def set_station_offset(self, offset: int):
+        box = text_box(Layout.STATION_NAME_POSITION, STATION_NAME_VISIBLE_CHARS * Layout.CHAR_WIDTH)
+        strip = self.strip
+        self.regions.set_region(
+            "station_name", box, (STATION_NAME, offset), lambda: strip.crop((offset, 0, offset + box[2], box[3]))
+        )
+
+    def set_times(self, direction: str, times, color):
+        positions = (
+            (Layout.UPTOWN_TIME_1_POSITION, Layout.UPTOWN_TIME_2_POSITION, Layout.UPTOWN_TIME_3_POSITION)
+            if direction == "uptown"
+            else (Layout.DOWNTOWN_TIME_1_POSITION, Layout.DOWNTOWN_TIME_2_POSITION, Layout.DOWNTOWN_TIME_3_POSITION)
+        )
+        for index, (label, position) in enumerate(zip(times, positions), start=1):
+            self._set_text(f"{direction}_time_{index}", label, position, Layout.TIME_BOX_WIDTH, color)
+
+
+def legacy_frame_clears() -> List[Area]:
+    """The boxes one per-pixel full view redraw cleared."""
+    areas: List[Area] = [
+        (Layout.ICON_POSITION, Layout.ICON_SIZE),
+        (
+            (Layout.STATION_NAME_POSITION[0], max(0, Layout.STATION_NAME_POSITION[1] - Layout.CHAR_HEIGHT - 1)),
+            (STATION_NAME_VISIBLE_CHARS * Layout.CHAR_WIDTH, Layout.CHAR_HEIGHT + 2),
+        ),
+    ]
+    for position in (
+        Layout.UPTOWN_TIME_1_POSITION,
+        Layout.UPTOWN_TIME_2_POSITION,
+        Layout.UPTOWN_TIME_3_POSITION,
+        Layout.DOWNTOWN_TIME_1_POSITION,
+        Layout.DOWNTOWN_TIME_2_POSITION,
+        Layout.DOWNTOWN_TIME_3_POSITION,
+    ):
+        areas.append(((position[0], position[1] - Layout.CHAR_HEIGHT), (Layout.TIME_BOX_WIDTH, Layout.TIME_BOX_HEIGHT)))
+    for icon_position, offset in ((Layout.BIKE_ICON_POSITION, 11), (Layout.EBIKE_ICON_POSITION, 5)):
+        areas.append(((icon_position[0] + offset, icon_position[1]), (Layout.CHAR_WIDTH * 2, Layout.CHAR_HEIGHT)))
+    return areas
+
+
+def pixel_draw_icon(canvas, bitmap: Bitmap, position: Tuple[int, int], color: Tuple[int, int, int]):
+    x, y = position
+    mask = bitmap.mask.load()
+    for row in range(bitmap.size[1]):
+        for col in range(bitmap.size[0]):
+            if mask[col, row]:
+                canvas.SetPixel(x + col, y + row, color[0], color[1], color[2])
+
+
+def pixel_frame(canvas, areas: List[Area]):
+    for position, size in areas:
+        for col in range(position[0], position[0] + size[0]):
+            for row in range(position[1], position[1] + size[1]):
+                if 0 <= col < PANEL_SIZE[0] and 0 <= row < PANEL_SIZE[1]:
+                    canvas.SetPixel(col, row, 0, 0, 0)
+    pixel_draw_icon(canvas, BIKE_ICON, Layout.BIKE_ICON_POSITION, Colors.DAZZLING_BLUE)
+    pixel_draw_icon(canvas, EBIKE_ICON, Layout.EBIKE_ICON_POSITION, Colors.DAZZLING_BLUE)
+
+
+def scenarios(scene: BoardScene, chain: SwapChain) -> Dict[str, Callable[[int], int]]:
+    """Per-frame callables returning how many SetImage blits they made."""
+    areas = legacy_frame_clears()
+
+    def present() -> int:
+        blits = scene.regions.present(chain.back)
+        chain.swap()
+        return blits
+
+    def pixel(frame: int) -> int:
+        pixel_frame(chain.back, areas)
+        chain.swap()
+        return 0
+
+    def full(frame: int) -> int:
+        scene.regions.invalidate()
+        return present()
+
+    def countdown(frame: int) -> int:
+        scene.set_times("uptown", (f"{frame % 60}m",) + UPTOWN_TIMES[1:], Colors.GREEN)
+        return present()
+
+    def scroll(frame: int) -> int:
+        scene.set_station_offset(frame % scene.period if scene.period else 0)
+        return present()
+
+    def idle(frame: int) -> int:
+        return present()
+
+    return {"pixel": pixel, "full": full, "countdown": countdown, "scroll": scroll, "idle": idle}
+
+
+def time_frames(draw: Callable[[int], int], frames: int) -> Tuple[List[float], int]:
+    samples = []
+    blits = 0
+    for frame in range(frames):
+        start = time.perf_counter()
+        blits += draw(frame)
+        samples.append((time.perf_counter() - start) * 1e6)
+    return samples, blits
+
+
+def hit_rate(cache: FrameCache, before: Tuple[int, int]) -> str:
+    """Hit percentage since ``before`` (hits, misses), or '-' if the cache was unused."""
+    hits, misses = cache.hits - before[0], cache.misses - before[1]
+    return f"{100 * hits / (hits + misses):3.0f}%" if hits + misses else "   -"
+
+
+def create_canvases(use_matrix: bool) -> List:
+    if not use_matrix:
+        return [PillowCanvas(), PillowCanvas()]
+    from rgbmatrix import RGBMatrix, RGBMatrixOptions
+
+    options = RGBMatrixOptions()
+    options.cols, options.rows = PANEL_SIZE
+    options.hardware_mapping = "adafruit-hat"
+    options.gpio_slowdown = 5
+    matrix = RGBMatrix(options=options)
+    return [matrix.CreateFrameCanvas(), matrix.CreateFrameCanvas()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument("--matrix", action="store_true", help="Draw on a real rgbmatrix canvas")
+    args = parser.parse_args()
+
+    scene = BoardScene(BdfFont.load(FONT_PATH))
+    chain = SwapChain(create_canvases(args.matrix))
+    print(f"Board view, {args.frames} frames on {'rgbmatrix' if args.matrix else 'Pillow'} canvases")
+
+    tiles, frames = scene.regions.tile_cache, scene.regions.frame_cache
+    results = {}
+    for label, draw in scenarios(scene, chain).items():
+        time_frames(draw, min(100, args.frames))  # warm caches and buffer history
+        tiles_before, frames_before = (tiles.hits, tiles.misses), (frames.hits, frames.misses)
+        samples, blits = time_frames(draw, args.frames)
+        results[label] = statistics.median(samples)
+        print(
+            f"  {label:<10} median {results[label]:8.1f} µs/frame   "
+            f"p95 {statistics.quantiles(samples, n=20)[-1]:8.1f} µs   "
+            f"{blits / args.frames:4.1f} blits/frame   "
+            f"tile hits {hit_rate(tiles, tiles_before)}   frame hits {hit_rate(frames, frames_before)}"
+        )
+    for label in ("full", "countdown", "scroll"):
+        print(f"  {label} vs pixel: {results['pixel'] / results[label]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
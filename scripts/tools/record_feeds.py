@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Record raw GTFS-realtime snapshots from every MTA feed into an append-only archive.
+
+Each poll fetches all feeds in mta_feeds.FEEDS and appends the binary payload
+(zlib-compressed) when the feed header timestamp changed since the last record.
+Replay the archive with scripts/tools/replay_feed_server.py.
+
+Usage:
+  ./scripts/tools/record_feeds.py [--interval 30] [--duration 3600]
+  ./scripts/tools/record_feeds.py --archive data/feed_archive.bin --feeds ace l
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from mta_feeds import FEEDS  # noqa: E402
+from mta_pi_led.services.feed_captures import FeedArchiveWriter  # noqa: E402
+from mta_pi_led.services.feed_header import read_feed_header_timestamp  # noqa: E402
+from mta_pi_led.services.http_client import http_get  # noqa: E402
+
+DEFAULT_ARCHIVE_PATH = PROJECT_ROOT / "data" / "feed_archive.bin"
+
+
+def record_once(
+    writer: FeedArchiveWriter,
+    feed_keys: List[str],
+    last_header_timestamps: Dict[str, int],
+) -> int:
+    """Fetch each feed once; return how many new snapshots were appended."""
+    appended = 0
+    for feed_key in feed_keys:
+        try:
+            response = http_get(FEEDS[feed_key], headers={"Accept": "application/x-google-protobuf"})
+            response.raise_for_status()
+            timestamp = read_feed_header_timestamp(response.content) or 0
+        except Exception as exc:
+            print(f"✗ {feed_key}: {exc}")
+            continue
+
+        if timestamp and last_header_timestamps.get(feed_key) == timestamp:
+            continue
+        writer.append(feed_key, time.time(), response.content)
+        last_header_timestamps[feed_key] = timestamp
+        appended += 1
+    return appended
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--archive", default=str(DEFAULT_ARCHIVE_PATH))
+    parser.add_argument("--interval", type=float, default=30.0, help="Seconds between polls")
+    parser.add_argument("--duration", type=float, help="Stop after this many seconds")
+    parser.add_argument("--feeds", nargs="+", choices=sorted(FEEDS), help="Subset of feed keys")
+    args = parser.parse_args()
+
+    feed_keys = args.feeds or list(FEEDS)
+    deadline = time.monotonic() + args.duration if args.duration else None
+    last_header_timestamps: Dict[str, int] = {}
+
+    print(f"🎥 Recording {len(feed_keys)} feeds every {args.interval:g}s → {args.archive}")
+    with FeedArchiveWriter(args.archive) as writer:
+        try:
+            while deadline is None or time.monotonic() < deadline:
+                started = time.monotonic()
+                appended = record_once(writer, feed_keys, last_header_timestamps)
+                print(f"✓ {time.strftime('%H:%M:%S')} appended {appended}/{len(feed_keys)} snapshots")
+                time.sleep(max(0.0, args.interval - (time.monotonic() - started)))
+        except KeyboardInterrupt:
+            pass
+    print(f"✓ Archive size {Path(args.archive).stat().st_size / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
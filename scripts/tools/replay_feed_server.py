@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Serve recorded GTFS-realtime feeds at the MTA URL paths for offline load tests.
+
+Snapshots come from an archive written by record_feeds.py, or from the newest
+raw_feed_* capture per feed. A replay clock walks through the recording at
+--speed times real time (looping at the end), and every timestamp in a served
+feed is shifted so the snapshot looks current to the wall clock. The shift is
+fixed while a snapshot is being served, so repeat requests get the same ETag
+and a 304 just as they would from the MTA.
+
+Point the board, web controller or benchmarks at it with:
+  MTA_FEED_BASE_URL=http://127.0.0.1:8765 ./scripts/web/start.sh
+
+Usage:
+  ./scripts/tools/replay_feed_server.py [--archive data/feed_archive.bin] [--speed 10]
+  ./scripts/tools/replay_feed_server.py --captures-dir examples
+"""
+
+import argparse
+import bisect
+import sys
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from mta_feeds import FEED_PATHS  # noqa: E402
+from mta_pi_led.services.feed_captures import (  # noqa: E402
+    iter_archive,
+    load_latest_captures,
+    shift_feed_times,
+)
+from mta_pi_led.services.feed_header import read_feed_header_timestamp  # noqa: E402
+
+DEFAULT_ARCHIVE_PATH = PROJECT_ROOT / "data" / "feed_archive.bin"
+# A snapshot held longer than this (e.g. a feed with a single capture) is
+# re-shifted to now, like the MTA publishing a new header every ~30s.
+RESHIFT_SECONDS = 30
+
+# feed key -> (recorded times, raw payloads), both sorted by recorded time
+Recording = Dict[str, Tuple[List[float], List[bytes]]]
+
+
+def load_archive(path: Path) -> Recording:
+    snapshots: Dict[str, List[Tuple[float, bytes]]] = {}
+    for record in iter_archive(path):
+        snapshots.setdefault(record.feed_key, []).append((record.captured_at, record.content))
+    return _to_recording(snapshots)
+
+
+def load_captures(captures_dir: Optional[str]) -> Recording:
+    snapshots: Dict[str, List[Tuple[float, bytes]]] = {}
+    for feed_key, content in load_latest_captures(captures_dir).items():
+        snapshots[feed_key] = [(float(read_feed_header_timestamp(content) or 0), content)]
+    return _to_recording(snapshots)
+
+
+def _to_recording(snapshots: Dict[str, List[Tuple[float, bytes]]]) -> Recording:
+    recording: Recording = {}
+    for feed_key, entries in snapshots.items():
+        entries.sort(key=lambda entry: entry[0])
+        recording[feed_key] = ([entry[0] for entry in entries], [entry[1] for entry in entries])
+    return recording
+
+
+class ReplayClock:
+    """Map wall-clock time onto the recording, optionally accelerated and looped."""
+
+    def __init__(self, recording: Recording, speed: float):
+        all_times = [t for times, _ in recording.values() for t in times]
+        self.start = min(all_times)
+        self.span = max(all_times) - self.start
+        self.speed = speed
+        self.wall_start = time.time()
+
+    def recorded_now(self, wall_now: float) -> float:
+        elapsed = (wall_now - self.wall_start) * self.speed
+        if self.span > 0:
+            elapsed %= self.span + 1
+        return self.start + elapsed
+
+
+class FeedReplay:
+    def __init__(self, recording: Recording, clock: ReplayClock, shift_to_now: bool):
+        self.recording = recording
+        self.clock = clock
+        self.shift_to_now = shift_to_now
+        self._lock = threading.Lock()
+        # feed key -> (snapshot index, offset, wall time shifted, shifted payload)
+        self._shifted: Dict[str, Tuple[int, int, float, bytes]] = {}
+
+    def snapshot(self, feed_key: str) -> Optional[Tuple[str, int, bytes]]:
+        """Return (etag, header timestamp, payload) for the feed at the replay time."""
+        entry = self.recording.get(feed_key)
+        if entry is None:
+            return None
+        times, payloads = entry
+
+        wall_now = time.time()
+        recorded_now = self.clock.recorded_now(wall_now)
+        index = max(0, bisect.bisect_right(times, recorded_now) - 1)
+
+        with self._lock:
+            cached = self._shifted.get(feed_key)
+            # The offset is chosen once per served snapshot: recomputing it per
+            # request drifts every second when --speed != 1, giving each
+            # request a new payload and ETag.
+            if cached is None or cached[0] != index or wall_now - cached[2] >= RESHIFT_SECONDS:
+                offset = int(wall_now - recorded_now) if self.shift_to_now else 0
+                payload = shift_feed_times(payloads[index], offset) if offset else payloads[index]
+                cached = (index, offset, wall_now, payload)
+                self._shifted[feed_key] = cached
+        _, offset, _, payload = cached
+
+        etag = f'"{feed_key}-{index}-{offset}"'
+        return etag, int(times[index]) + offset, payload
+
+
+def make_handler(replay: FeedReplay, verbose: bool):
+    feed_key_by_path = {path: feed_key for feed_key, path in FEED_PATHS.items()}
+
+    class ReplayHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            feed_key = feed_key_by_path.get(self.path.split("?", 1)[0])
+            snapshot = replay.snapshot(feed_key) if feed_key else None
+            if snapshot is None:
+                self.send_error(404, "Unknown or unrecorded feed")
+                return
+
+            etag, timestamp, payload = snapshot
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-google-protobuf")
+            self.send_header("Content-Length", str(len(payload)))
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", formatdate(timestamp, usegmt=True))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):  # noqa: A002
+            if verbose:
+                super().log_message(format, *args)
+
+    return ReplayHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--archive", help=f"Archive from record_feeds.py (default {DEFAULT_ARCHIVE_PATH})")
+    source.add_argument("--captures-dir", help="Serve the newest raw_feed_* capture per feed")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay clock multiplier")
+    parser.add_argument(
+        "--no-shift",
+        action="store_true",
+        help="Serve recorded timestamps unchanged instead of shifting them to now",
+    )
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    if args.captures_dir:
+        recording = load_captures(args.captures_dir)
+    else:
+        archive_path = Path(args.archive) if args.archive else DEFAULT_ARCHIVE_PATH
+        recording = load_archive(archive_path) if archive_path.exists() else load_captures(None)
+    if not recording:
+        raise SystemExit("✗ Nothing to replay")
+
+    clock = ReplayClock(recording, args.speed)
+    replay = FeedReplay(recording, clock, shift_to_now=not args.no_shift)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(replay, args.verbose))
+
+    snapshot_count = sum(len(times) for times, _ in recording.values())
+    print(
+        f"▶️  Replaying {snapshot_count} snapshots of {len(recording)} feeds "
+        f"({clock.span:.0f}s recorded, {args.speed:g}x) on http://{args.host}:{args.port}"
+    )
+    print(f"   export MTA_FEED_BASE_URL=http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,47 +1,64 @@
 from flask import Flask, render_template, request, jsonify
-import requests
+from bisect import insort
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from datetime import datetime, timezone
 import logging
+from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
 from google.transit import gtfs_realtime_pb2
-import os
-from typing import Any, Dict, Iterable, List, Optional
-from mta_feeds import FEEDS, ROUTE_TO_FEED
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from mta_feeds import FEEDS, ROUTE_TO_FEED, get_feed_refresh_policy
+from mta_pi_led.services.arrival_times import minutes_until, minutes_until_batch, web_label
+from mta_pi_led.services.feed_cache import (
+    FeedCache,
+    FeedFetchResult,
+    FeedSnapshot,
+    resolve_feed_cache_ttl_seconds,
+    resolve_feed_ttls,
+)
+from mta_pi_led.services.feed_header import read_feed_header_timestamp
+from mta_pi_led.logging_config import configure_logging
+from mta_pi_led.services.http_client import http_get
 from station_data import load_station_data, is_valid_station, get_default_station, get_station_name, get_station_lines, get_station_direction_codes
 from route_data import load_route_data
 
 app = Flask(__name__)
+logger = logging.getLogger(__name__)
 
 # Load station and route data
 STATIONS = load_station_data()
 ROUTES = load_route_data()
 
-LOG_DIR = os.path.join(os.path.dirname(__file__), '..', 'logs')
-LOG_PATH = os.path.join(LOG_DIR, 'mta_debug.log')
 GTFS_HEADERS = {'Accept': 'application/x-google-protobuf'}
+# Fallback request timeout; feeds normally use their mta_feeds refresh policy.
+FEED_REQUEST_TIMEOUT_SECONDS = 10
+# Shared wall-clock budget for one refresh; feeds still in flight are skipped.
+FEED_FETCH_DEADLINE_SECONDS = 12
+# One worker per feed, so a refresh takes as long as its slowest feed.
+FEED_FETCH_MAX_WORKERS = len(FEEDS)
+# When the deadline passes with feeds still in flight, those at or below this
+# priority get a short grace period; the rest are served stale right away.
+FEED_GRACE_MAX_PRIORITY = 0
+FEED_GRACE_SECONDS = 3
+# A failing or backing-off feed is served from its last good snapshot up to
+# this age; older data is dropped so stations show no trains instead.
+FEED_MAX_STALENESS_SECONDS = 300
+# Arrivals kept per station/route/direction; the LED board shows three.
+ARRIVALS_PER_DIRECTION = 3
+# Extra arrivals a cached feed scan keeps per direction, so it can be reused
+# while trains pass: a scan lives for one feed interval, plus up to
+# FEED_MAX_STALENESS_SECONDS while the feed is served stale (~6 min, about six
+# trains at peak headways). A scan whose spares have all passed is redone.
+FEED_SCAN_SPARE_ARRIVALS = 6
+# Plans watching at most this many stop ids decode feeds selectively. On the
+# example feeds (scripts/bench/bench_feed_decode.py) single-station plans gain
+# ~2x, while two trunk stations already match most trips and lose to a full parse.
+SELECTIVE_DECODE_MAX_STOPS = 2
+# Upper bound on station ids accepted by one /api/arrivals request.
+BATCH_ENDPOINT_MAX_STATIONS = 50
 
-def clear_log_file():
-    # Clear the log file
-    try:
-        os.makedirs(LOG_DIR, exist_ok=True)
-        with open(LOG_PATH, 'w') as f:
-            f.write('')
-    except PermissionError:
-        pass  # Skip if can't write to log
-
-def setup_logging():
-    try:
-        os.makedirs(LOG_DIR, exist_ok=True)
-        logging.basicConfig(
-            filename=LOG_PATH,
-            level=logging.DEBUG,
-            format='%(asctime)s - %(levelname)s - %(message)s'
-        )
-    except PermissionError:
-        # Fall back to console logging if can't write to file
-        logging.basicConfig(
-            level=logging.DEBUG,
-            format='%(asctime)s - %(levelname)s - %(message)s'
-        )
 
 def _normalize_route(route_id: str) -> str:
     route = str(route_id).strip().upper()
@@ -66,7 +83,7 @@ def _normalize_station_ids(selected_stations: Iterable[Any]) -> List[str]:
         station_ids.append(station_id)
 
     if invalid:
-        logging.warning(
+        logger.warning(
             "Ignoring invalid station ids in batch request: %s",
             ", ".join(invalid),
         )
@@ -110,17 +127,28 @@ def _build_station_routes(
 
 
 def _initialize_route_times_by_station(
-    station_routes: Dict[str, List[str]]
-) -> Dict[str, Dict[str, Dict[str, set[int]]]]:
-    route_times_by_station: Dict[str, Dict[str, Dict[str, set[int]]]] = {}
+    station_routes: Dict[str, Tuple[str, ...]]
+) -> Dict[str, Dict[str, Dict[str, List[int]]]]:
+    route_times_by_station: Dict[str, Dict[str, Dict[str, List[int]]]] = {}
     for station_id, routes in station_routes.items():
         route_times_by_station[station_id] = {
-            route: {'uptown': set(), 'downtown': set()}
+            route: {'uptown': [], 'downtown': []}
             for route in routes
         }
     return route_times_by_station
 
 
+def _push_arrival(times: List[int], arrival_time: int, limit: int):
+    """Keep `times` as the sorted, de-duplicated `limit` soonest arrivals."""
+    if len(times) >= limit and arrival_time >= times[-1]:
+        return
+    if arrival_time in times:
+        return
+    insort(times, arrival_time)
+    if len(times) > limit:
+        times.pop()
+
+
 def _build_stop_to_station_index(station_ids: List[str]) -> Dict[str, List[str]]:
     stop_to_stations: Dict[str, List[str]] = {}
     for station_id in station_ids:
@@ -149,19 +177,342 @@ def _get_needed_feed_keys(station_routes: Dict[str, List[str]]) -> List[str]:
     return sorted(feed_keys)
 
 
-def _process_feed_for_batch(
+@dataclass(frozen=True)
+class WatchPlan:
+    """Lookup tables for one station set, compiled once and reused per refresh."""
+
+    station_ids: Tuple[str, ...]
+    station_routes: Dict[str, Tuple[str, ...]]
+    stop_to_stations: Dict[str, Tuple[str, ...]]
+    route_targets: Dict[str, frozenset[str]]
+    feed_keys: Tuple[str, ...]
+    arrivals_per_direction: int
+    signature: Tuple[Any, ...]
+    # Set when the plan is small enough for `decode_feed_selectively`.
+    stop_pattern: Optional[re.Pattern[bytes]] = None
+
+
+WatchPlanKey = Tuple[Tuple[str, ...], Tuple[Tuple[str, Tuple[str, ...]], ...]]
+_WATCH_PLAN_CACHE: Dict[WatchPlanKey, WatchPlan] = {}
+_WATCH_PLAN_LOCK = threading.Lock()
+WATCH_PLAN_CACHE_MAX_ENTRIES = 32
+
+
+def build_watch_plan(
+    selected_stations: Iterable[Any],
+    preferred_routes_by_station: Optional[Dict[str, List[str]]] = None,
+    arrivals_per_direction: int = ARRIVALS_PER_DIRECTION,
+) -> WatchPlan:
+    """Normalize stations/routes and build the stop and route indexes."""
+    station_ids = _normalize_station_ids(selected_stations)
+    station_routes = _build_station_routes(station_ids, preferred_routes_by_station)
+    stop_to_stations = _build_stop_to_station_index(station_ids)
+    route_targets = _build_route_targets(station_routes)
+    compact_station_routes = {
+        station_id: tuple(routes) for station_id, routes in station_routes.items()
+    }
+    return WatchPlan(
+        station_ids=tuple(station_ids),
+        station_routes=compact_station_routes,
+        stop_to_stations={
+            stop_id: tuple(stations) for stop_id, stations in stop_to_stations.items()
+        },
+        route_targets={
+            route: frozenset(stations) for route, stations in route_targets.items()
+        },
+        feed_keys=tuple(_get_needed_feed_keys(station_routes)),
+        arrivals_per_direction=max(1, arrivals_per_direction),
+        signature=(max(1, arrivals_per_direction),) + tuple(compact_station_routes.items()),
+        stop_pattern=_build_stop_pattern(stop_to_stations),
+    )
+
+
+def _build_stop_pattern(stop_to_stations: Dict[str, List[str]]) -> Optional[re.Pattern[bytes]]:
+    if not stop_to_stations or len(stop_to_stations) > SELECTIVE_DECODE_MAX_STOPS:
+        return None
+    # Longest first so the alternation never stops at a shorter prefix.
+    stop_ids = sorted(stop_to_stations, key=len, reverse=True)
+    return re.compile(b'|'.join(re.escape(stop_id.encode()) for stop_id in stop_ids))
+
+
+def _watch_plan_key(
+    selected_stations: Iterable[Any],
+    preferred_routes_by_station: Optional[Dict[str, List[str]]],
+) -> WatchPlanKey:
+    station_key = tuple(str(station_id).strip().upper() for station_id in selected_stations)
+    preferred_key = tuple(
+        (str(station_id).strip().upper(), tuple(str(route) for route in routes))
+        for station_id, routes in (preferred_routes_by_station or {}).items()
+    )
+    return station_key, preferred_key
+
+
+def get_watch_plan(
+    selected_stations: Iterable[Any],
+    preferred_routes_by_station: Optional[Dict[str, List[str]]] = None,
+) -> WatchPlan:
+    """Return a cached watch plan for this station set, building it on first use."""
+    selected_stations = list(selected_stations)
+    key = _watch_plan_key(selected_stations, preferred_routes_by_station)
+    with _WATCH_PLAN_LOCK:
+        plan = _WATCH_PLAN_CACHE.get(key)
+    if plan is not None:
+        return plan
+
+    plan = build_watch_plan(selected_stations, preferred_routes_by_station)
+    with _WATCH_PLAN_LOCK:
+        while len(_WATCH_PLAN_CACHE) >= WATCH_PLAN_CACHE_MAX_ENTRIES:
+            _WATCH_PLAN_CACHE.pop(next(iter(_WATCH_PLAN_CACHE)))
+        _WATCH_PLAN_CACHE[key] = plan
+    return plan
+
+
+def invalidate_watch_plans():
+    """Drop cached watch plans (called when the board config reloads)."""
+    with _WATCH_PLAN_LOCK:
+        _WATCH_PLAN_CACHE.clear()
+
+
+def _fetch_feed(
     feed_url: str,
-    current_time: int,
-    stop_to_stations: Dict[str, List[str]],
-    route_targets: Dict[str, set[str]],
-    route_times_by_station: Dict[str, Dict[str, Dict[str, set[int]]]],
-) -> Dict[str, set[str]]:
-    response = requests.get(feed_url, headers=GTFS_HEADERS, timeout=10)
+    previous: Optional[FeedSnapshot] = None,
+    timeout: float = FEED_REQUEST_TIMEOUT_SECONDS,
+) -> Optional[FeedFetchResult]:
+    """Fetch raw feed bytes; return None when unchanged since `previous`."""
+    headers = dict(GTFS_HEADERS)
+    if previous is not None:
+        if previous.etag:
+            headers['If-None-Match'] = previous.etag
+        if previous.last_modified:
+            headers['If-Modified-Since'] = previous.last_modified
+
+    response = http_get(
+        feed_url,
+        headers=headers,
+        timeout=timeout,
+    )
+    if response.status_code == 304 and previous is not None:
+        return None
     response.raise_for_status()
 
+    header_timestamp = read_feed_header_timestamp(response.content)
+    if (
+        previous is not None
+        and header_timestamp
+        and header_timestamp == previous.header_timestamp
+    ):
+        return None
+
+    return FeedFetchResult(
+        content=response.content,
+        header_timestamp=header_timestamp or 0,
+        etag=response.headers.get('ETag'),
+        last_modified=response.headers.get('Last-Modified'),
+    )
+
+
+def _parse_feed(content: bytes) -> gtfs_realtime_pb2.FeedMessage:
+    feed = gtfs_realtime_pb2.FeedMessage()
+    feed.ParseFromString(content)
+    return feed
+
+
+def _build_selective_message_classes() -> Tuple[Any, Any]:
+    """Build slim look-alikes of FeedMessage/FeedEntity that keep nested parts as bytes.
+
+    Field numbers mirror gtfs-realtime.proto, so real feed bytes parse into
+    them while only entity/stop_time_update boundaries are decoded.
+    """
+    field_proto = descriptor_pb2.FieldDescriptorProto
+    file_proto = descriptor_pb2.FileDescriptorProto(
+        name='mta_pi_led_selective_feed.proto',
+        package='mta_pi_led',
+        syntax='proto2',
+    )
+
+    def add_message(name: str, fields: List[Tuple[str, int, int, int, str]]):
+        message_proto = file_proto.message_type.add(name=name)
+        for field_name, number, field_type, label, type_name in fields:
+            field = message_proto.field.add(
+                name=field_name,
+                number=number,
+                type=field_type,
+                label=label,
+            )
+            if type_name:
+                field.type_name = type_name
+
+    add_message('SlimTrip', [
+        ('route_id', 5, field_proto.TYPE_STRING, field_proto.LABEL_OPTIONAL, ''),
+    ])
+    add_message('SlimTripUpdate', [
+        ('trip', 1, field_proto.TYPE_MESSAGE, field_proto.LABEL_OPTIONAL, '.mta_pi_led.SlimTrip'),
+        ('stop_time_update', 2, field_proto.TYPE_BYTES, field_proto.LABEL_REPEATED, ''),
+    ])
+    add_message('SlimEntity', [
+        ('trip_update', 3, field_proto.TYPE_MESSAGE, field_proto.LABEL_OPTIONAL, '.mta_pi_led.SlimTripUpdate'),
+    ])
+    add_message('EntityBytesFeed', [
+        ('entity', 2, field_proto.TYPE_BYTES, field_proto.LABEL_REPEATED, ''),
+    ])
+
+    pool = descriptor_pool.DescriptorPool()
+    pool.Add(file_proto)
+    return (
+        message_factory.GetMessageClass(pool.FindMessageTypeByName('mta_pi_led.EntityBytesFeed')),
+        message_factory.GetMessageClass(pool.FindMessageTypeByName('mta_pi_led.SlimEntity')),
+    )
+
+
+EntityBytesFeed, SlimEntity = _build_selective_message_classes()
+
+
+def decode_feed_selectively(
+    content: bytes,
+    stop_pattern: re.Pattern[bytes],
+    route_targets: Dict[str, frozenset[str]],
+) -> gtfs_realtime_pb2.FeedMessage:
+    """Materialize only watched trip updates and their watched stop_time_updates.
+
+    Entities and stop_time_updates stay raw bytes until a single regex scan
+    finds a watched stop id in them, and trips are dropped by route before
+    any stop is decoded. The result carries only `trip.route_id` and the
+    matching stop_time_updates, which is all `_process_feed_for_batch` reads.
+    """
     feed = gtfs_realtime_pb2.FeedMessage()
-    feed.ParseFromString(response.content)
+    for entity_bytes in EntityBytesFeed.FromString(content).entity:
+        if stop_pattern.search(entity_bytes) is None:
+            continue
+
+        slim_trip_update = SlimEntity.FromString(entity_bytes).trip_update
+        route_id = slim_trip_update.trip.route_id
+        if _normalize_route(route_id) not in route_targets:
+            continue
+
+        trip_update = feed.entity.add().trip_update
+        trip_update.trip.route_id = route_id
+        for stop_time_update_bytes in slim_trip_update.stop_time_update:
+            if stop_pattern.search(stop_time_update_bytes) is not None:
+                trip_update.stop_time_update.add().MergeFromString(stop_time_update_bytes)
+    return feed
+
+
+def _fetch_feed_by_key(
+    feed_key: str,
+    previous: Optional[FeedSnapshot],
+) -> Optional[FeedFetchResult]:
+    return _fetch_feed(
+        FEEDS[feed_key],
+        previous,
+        timeout=get_feed_refresh_policy(feed_key)['timeout'],
+    )
+
+
+# Shared by the LED loop and every web route so each feed is downloaded at most
+# once per its own refresh interval no matter how many callers ask for it.
+FEED_CACHE = FeedCache(
+    _fetch_feed_by_key,
+    _parse_feed,
+    ttl_seconds=resolve_feed_cache_ttl_seconds(),
+    ttl_by_key=resolve_feed_ttls(
+        {feed_key: get_feed_refresh_policy(feed_key)['interval'] for feed_key in FEEDS}
+    ),
+    wait_timeout_seconds=FEED_FETCH_DEADLINE_SECONDS,
+)
+
+FeedRouteTimes = Dict[str, Dict[str, Dict[str, List[int]]]]
+# (feed_key, watch plan signature) ->
+#     (feed header timestamp, reusable until (None: no limit), parsed route times)
+_FEED_ROUTE_TIMES_CACHE: Dict[
+    Tuple[str, Tuple[Any, ...]], Tuple[int, Optional[int], FeedRouteTimes]
+] = {}
+_FEED_ROUTE_TIMES_LOCK = threading.Lock()
+FEED_ROUTE_TIMES_CACHE_MAX_ENTRIES = 32
+
+
+def _fetch_feeds_concurrently(
+    feed_keys: Iterable[str],
+    deadline_seconds: float = FEED_FETCH_DEADLINE_SECONDS,
+) -> Dict[str, FeedSnapshot]:
+    """Return cached or freshly downloaded feeds that are ready before the deadline."""
+    feeds: Dict[str, FeedSnapshot] = {}
+    missing_keys: List[str] = []
+    failed_keys: List[str] = []
+    for feed_key in feed_keys:
+        # Each feed expires on its own interval; only the due ones are downloaded.
+        cached = FEED_CACHE.get_fresh(feed_key)
+        if cached is not None:
+            feeds[feed_key] = cached
+        elif FEED_CACHE.is_circuit_open(feed_key):
+            logger.debug("Feed %s circuit open; skipping fetch", feed_key)
+            failed_keys.append(feed_key)
+        else:
+            missing_keys.append(feed_key)
+    if not missing_keys:
+        _serve_stale_feeds(failed_keys, feeds)
+        return feeds
+
+    executor = ThreadPoolExecutor(
+        max_workers=min(len(missing_keys), FEED_FETCH_MAX_WORKERS),
+        thread_name_prefix='feed-fetch',
+    )
+    try:
+        futures = {
+            executor.submit(FEED_CACHE.get, feed_key): feed_key
+            for feed_key in missing_keys
+        }
+        done, not_done = wait(futures, timeout=deadline_seconds)
+        grace = [
+            future for future in not_done
+            if get_feed_refresh_policy(futures[future])['priority'] <= FEED_GRACE_MAX_PRIORITY
+        ]
+        if grace:
+            late, _ = wait(grace, timeout=FEED_GRACE_SECONDS)
+            done |= late
+            not_done -= late
+
+        for future in not_done:
+            logger.error(
+                "Timed out fetching feed %s after %ss", futures[future], deadline_seconds
+            )
+            failed_keys.append(futures[future])
+        for future in done:
+            feed_key = futures[future]
+            try:
+                feeds[feed_key] = future.result()
+            except Exception as feed_error:
+                logger.error("Error fetching feed %s: %s", feed_key, feed_error)
+                failed_keys.append(feed_key)
+    finally:
+        # Do not block the refresh on stragglers; they still fill the cache when done.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    _serve_stale_feeds(failed_keys, feeds)
+    return feeds
 
+
+def _serve_stale_feeds(failed_keys: Iterable[str], feeds: Dict[str, FeedSnapshot]):
+    """Fill in failed feeds with their last good snapshot while it is recent enough."""
+    for feed_key in failed_keys:
+        stale = FEED_CACHE.get_last_good(feed_key, FEED_MAX_STALENESS_SECONDS)
+        if stale is None:
+            continue
+        logger.warning(
+            "Serving feed %s from a %.0fs-old snapshot",
+            feed_key,
+            FEED_CACHE.age_seconds(stale),
+        )
+        feeds[feed_key] = stale
+
+
+def _process_feed_for_batch(
+    feed: gtfs_realtime_pb2.FeedMessage,
+    current_time: int,
+    stop_to_stations: Dict[str, Tuple[str, ...]],
+    route_targets: Dict[str, frozenset[str]],
+    route_times_by_station: Dict[str, Dict[str, Dict[str, List[int]]]],
+    arrivals_per_direction: int = ARRIVALS_PER_DIRECTION,
+) -> Dict[str, set[str]]:
     active_routes_by_station: Dict[str, set[str]] = {
         station_id: set() for station_id in route_times_by_station
     }
@@ -198,107 +549,281 @@ def _process_feed_for_batch(
             for station_id in station_ids_for_stop:
                 if station_id not in target_stations:
                     continue
-                route_times_by_station[station_id][base_route][direction].add(arrival_time)
+                _push_arrival(
+                    route_times_by_station[station_id][base_route][direction],
+                    arrival_time,
+                    arrivals_per_direction,
+                )
                 active_routes_by_station[station_id].add(base_route)
 
     return active_routes_by_station
 
+
+def _scan_feed_route_times(
+    feed: gtfs_realtime_pb2.FeedMessage,
+    current_time: int,
+    watch_plan: WatchPlan,
+) -> Tuple[FeedRouteTimes, Optional[int]]:
+    """Scan one feed for the plan's stations; return route times and a reuse deadline."""
+    feed_route_times = _initialize_route_times_by_station(watch_plan.station_routes)
+    # Keep spares beyond the plan's count: trains that pass while the scan is
+    # reused are backfilled from later ones at merge time.
+    scan_limit = watch_plan.arrivals_per_direction + FEED_SCAN_SPARE_ARRIVALS
+    _process_feed_for_batch(
+        feed,
+        current_time,
+        watch_plan.stop_to_stations,
+        watch_plan.route_targets,
+        feed_route_times,
+        arrivals_per_direction=scan_limit,
+    )
+    # A full list may have dropped later trains; once its spares have passed
+    # it can no longer fill the plan, so the feed must be scanned again.
+    reusable_until = min(
+        (
+            times[FEED_SCAN_SPARE_ARRIVALS]
+            for route_times in feed_route_times.values()
+            for direction_times in route_times.values()
+            for times in direction_times.values()
+            if len(times) >= scan_limit
+        ),
+        default=None,
+    )
+    feed_route_times = {
+        station_id: {
+            route: direction_times
+            for route, direction_times in route_times.items()
+            if direction_times['uptown'] or direction_times['downtown']
+        }
+        for station_id, route_times in feed_route_times.items()
+    }
+    return feed_route_times, reusable_until
+
+
+def _get_feed_route_times(
+    snapshot: FeedSnapshot,
+    current_time: int,
+    watch_plan: WatchPlan,
+) -> Tuple[FeedRouteTimes, bool]:
+    """Return this feed's route times, reusing the last scan if the feed is unchanged."""
+    cache_key = (snapshot.feed_key, watch_plan.signature)
+    with _FEED_ROUTE_TIMES_LOCK:
+        cached = _FEED_ROUTE_TIMES_CACHE.get(cache_key)
+    if (
+        cached is not None
+        and snapshot.header_timestamp
+        and cached[0] == snapshot.header_timestamp
+        and (cached[1] is None or current_time < cached[1])
+    ):
+        return cached[2], True
+
+    # Reuse a full parse if another caller already paid for it.
+    if watch_plan.stop_pattern is not None and not snapshot.is_parsed:
+        feed = decode_feed_selectively(
+            snapshot.content,
+            watch_plan.stop_pattern,
+            watch_plan.route_targets,
+        )
+    else:
+        feed = snapshot.feed
+
+    feed_route_times, reusable_until = _scan_feed_route_times(feed, current_time, watch_plan)
+
+    with _FEED_ROUTE_TIMES_LOCK:
+        _FEED_ROUTE_TIMES_CACHE.pop(cache_key, None)
+        while len(_FEED_ROUTE_TIMES_CACHE) >= FEED_ROUTE_TIMES_CACHE_MAX_ENTRIES:
+            _FEED_ROUTE_TIMES_CACHE.pop(next(iter(_FEED_ROUTE_TIMES_CACHE)))
+        _FEED_ROUTE_TIMES_CACHE[cache_key] = (
+            snapshot.header_timestamp,
+            reusable_until,
+            feed_route_times,
+        )
+    return feed_route_times, False
+
+
+def _merge_feed_route_times(
+    route_times_by_station: FeedRouteTimes,
+    feed_route_times: FeedRouteTimes,
+    current_time: int,
+    arrivals_per_direction: int = ARRIVALS_PER_DIRECTION,
+) -> List[str]:
+    """Copy the soonest future arrivals from one feed into the batch; return routes found."""
+    routes_found: set[str] = set()
+    for station_id, route_times in feed_route_times.items():
+        station_route_times = route_times_by_station[station_id]
+        for route, direction_times in route_times.items():
+            for direction, times in direction_times.items():
+                target_times = station_route_times[route][direction]
+                for arrival_time in times:
+                    if arrival_time > current_time:
+                        _push_arrival(target_times, arrival_time, arrivals_per_direction)
+                        routes_found.add(route)
+    return sorted(routes_found)
+
 def format_arrival_times(times, current_time):
-    next_arrivals = []
-    for t in times:
-        minutes = (t - current_time) / 60
-        if minutes < 1:
-            next_arrivals.append('Now')
-        else:
-            minutes = int(minutes + 0.5)
-            next_arrivals.append(f'{minutes} min')
-    return next_arrivals
+    return [web_label(minutes) for minutes in minutes_until(times, current_time)]
 
-def process_route_times(route_times, current_time, selected_station):
-    if not is_valid_station(selected_station):
-        selected_station = get_default_station()
-    
-    train_status = {}
-    for route_id, direction_data in route_times.items():
-        uptown_times = sorted(list(direction_data['uptown']))[:3]
-        downtown_times = sorted(list(direction_data['downtown']))[:3]
+def _direction_payload(times: List[int], minutes) -> Dict[str, Any]:
+    return {
+        'next_arrivals': [web_label(value) for value in minutes],
+        'arrival_times': list(times),
+        'minutes': minutes.tolist(),
+    }
 
-        if not uptown_times and not downtown_times:
-            continue
+def format_station_trains(
+    route_times_by_station: FeedRouteTimes,
+    station_ids: Iterable[str],
+    current_time: int,
+    arrivals_per_direction: int = ARRIVALS_PER_DIRECTION,
+) -> Dict[str, Dict[str, Any]]:
+    """Build `trains` payloads for many stations with one minutes pass.
+
+    Each direction carries the web labels plus raw `arrival_times` epochs and
+    `minutes`, so other consumers (the LED board) format without re-parsing.
+    """
+    station_ids = list(station_ids)
+    entries: List[Tuple[str, str, List[int], List[int]]] = []
+    for station_id in station_ids:
+        for route_id, direction_data in route_times_by_station.get(station_id, {}).items():
+            # Times are already kept sorted and bounded during the feed scan.
+            uptown_times = direction_data['uptown'][:arrivals_per_direction]
+            downtown_times = direction_data['downtown'][:arrivals_per_direction]
+            if uptown_times or downtown_times:
+                entries.append((station_id, route_id, uptown_times, downtown_times))
+
+    minutes_batches = minutes_until_batch(
+        [times for entry in entries for times in entry[2:]],
+        current_time,
+    )
 
-        uptown_arrivals = format_arrival_times(uptown_times, current_time)
-        downtown_arrivals = format_arrival_times(downtown_times, current_time)
-        if uptown_arrivals:
-            logging.debug(f"Route {route_id} - Uptown: {uptown_arrivals}")
-        if downtown_arrivals:
-            logging.debug(f"Route {route_id} - Downtown: {downtown_arrivals}")
-
-        train_status[route_id] = {
-            'uptown': {'next_arrivals': uptown_arrivals},
-            'downtown': {'next_arrivals': downtown_arrivals},
-            'color': ROUTES.get(route_id, {}).get('color', '#808080'),
-            'text_color': ROUTES.get(route_id, {}).get('text_color', '#FFFFFF'),
-            'name': ROUTES.get(route_id, {}).get('name', f'{route_id} Train')
+    trains_by_station: Dict[str, Dict[str, Any]] = {station_id: {} for station_id in station_ids}
+    for index, (station_id, route_id, uptown_times, downtown_times) in enumerate(entries):
+        uptown = _direction_payload(uptown_times, minutes_batches[2 * index])
+        downtown = _direction_payload(downtown_times, minutes_batches[2 * index + 1])
+        logger.debug(
+            "Route %s at %s - Uptown: %s | Downtown: %s",
+            route_id,
+            station_id,
+            uptown['next_arrivals'],
+            downtown['next_arrivals'],
+        )
+        route_info = ROUTES.get(route_id, {})
+        trains_by_station[station_id][route_id] = {
+            'uptown': uptown,
+            'downtown': downtown,
+            'color': route_info.get('color', '#808080'),
+            'text_color': route_info.get('text_color', '#FFFFFF'),
+            'name': route_info.get('name', f'{route_id} Train')
         }
-    return train_status
+    return trains_by_station
+
+def process_route_times(
+    route_times,
+    current_time,
+    selected_station,
+    arrivals_per_direction=ARRIVALS_PER_DIRECTION,
+):
+    if not is_valid_station(selected_station):
+        selected_station = get_default_station()
+
+    return format_station_trains(
+        {selected_station: route_times},
+        [selected_station],
+        current_time,
+        arrivals_per_direction,
+    )[selected_station]
 
 def get_train_status_batch(
     selected_stations: Iterable[Any],
     preferred_routes_by_station: Optional[Dict[str, List[str]]] = None,
+    watch_plan: Optional[WatchPlan] = None,
 ) -> Dict[str, Dict[str, Any]]:
+    """Return per-station payloads; a given `watch_plan` overrides the station args."""
+    selected_stations = list(selected_stations)
     try:
-        clear_log_file()
-        setup_logging()
-
-        station_ids = _normalize_station_ids(selected_stations)
-        station_routes = _build_station_routes(station_ids, preferred_routes_by_station)
-        route_times_by_station = _initialize_route_times_by_station(station_routes)
-        stop_to_stations = _build_stop_to_station_index(station_ids)
-        route_targets = _build_route_targets(station_routes)
-        needed_feeds = _get_needed_feed_keys(station_routes)
+        if watch_plan is None:
+            watch_plan = get_watch_plan(selected_stations, preferred_routes_by_station)
+        station_ids = watch_plan.station_ids
+        route_times_by_station = _initialize_route_times_by_station(watch_plan.station_routes)
+        needed_feeds = watch_plan.feed_keys
 
         current_time = int(datetime.now(timezone.utc).timestamp())
         timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
 
+        feeds = _fetch_feeds_concurrently(needed_feeds)
+        # Feeds with neither fresh nor stale data; their stations' arrivals are unknown.
+        missing_feeds = {feed_key for feed_key in needed_feeds if feed_key not in feeds}
+
+        # Merge on the calling thread, in stable feed order, once downloads finish.
         for feed_key in needed_feeds:
+            snapshot = feeds.get(feed_key)
+            if snapshot is None:
+                continue
             try:
-                active_routes_by_station = _process_feed_for_batch(
-                    FEEDS[feed_key],
+                feed_route_times, reused = _get_feed_route_times(
+                    snapshot,
                     current_time,
-                    stop_to_stations,
-                    route_targets,
-                    route_times_by_station,
+                    watch_plan,
                 )
-                routes_found = sorted(
-                    {
-                        route
-                        for routes in active_routes_by_station.values()
-                        for route in routes
-                    }
+                routes_found = _merge_feed_route_times(
+                    route_times_by_station,
+                    feed_route_times,
+                    current_time,
+                    watch_plan.arrivals_per_direction,
                 )
-                logging.debug(f"Found routes in feed {feed_key}: {routes_found}")
+                if reused:
+                    logger.debug("Feed %s unchanged; reused previous scan", feed_key)
+                logger.debug("Found routes in feed %s: %s", feed_key, routes_found)
             except Exception as feed_error:
-                logging.error(f"Error processing feed {feed_key}: {feed_error}")
-
+                logger.error("Error processing feed %s: %s", feed_key, feed_error)
+                missing_feeds.add(feed_key)
+
+        trains_by_station = format_station_trains(
+            route_times_by_station,
+            station_ids,
+            current_time,
+            watch_plan.arrivals_per_direction,
+        )
+        # Feeds served past their refresh interval (stale-while-revalidate).
+        stale_feed_ages = {
+            feed_key: int(FEED_CACHE.age_seconds(snapshot))
+            for feed_key, snapshot in feeds.items()
+            if FEED_CACHE.age_seconds(snapshot) >= FEED_CACHE.ttl_for(feed_key)
+        }
         station_payloads: Dict[str, Dict[str, Any]] = {}
         for station_id in station_ids:
-            train_status = process_route_times(
-                route_times_by_station.get(station_id, {}),
-                current_time,
-                station_id,
-            )
+            train_status = trains_by_station[station_id]
+            station_feeds: List[str] = []
+            if stale_feed_ages or missing_feeds:
+                station_feeds = _get_needed_feed_keys(
+                    {station_id: watch_plan.station_routes[station_id]}
+                )
+            station_stale_feeds = {
+                feed_key: stale_feed_ages[feed_key]
+                for feed_key in station_feeds
+                if feed_key in stale_feed_ages
+            }
             station_payloads[station_id] = {
                 'status': 'success',
                 'timestamp': timestamp,
                 'trains': train_status,
                 'active_routes': list(train_status.keys()),
                 'station_name': get_station_name(station_id),
+                'stale_feeds': station_stale_feeds,
+                'missing_feeds': [
+                    feed_key for feed_key in station_feeds if feed_key in missing_feeds
+                ],
+                'data_age_seconds': max(station_stale_feeds.values(), default=0),
             }
         return station_payloads
 
     except Exception as error:
-        logging.error(f"Error: {error}")
-        fallback_station_ids = _normalize_station_ids(selected_stations)
+        logger.error("Error: %s", error)
+        fallback_station_ids = (
+            watch_plan.station_ids
+            if watch_plan is not None
+            else _normalize_station_ids(selected_stations)
+        )
         timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
         return {
             station_id: {
@@ -362,5 +887,35 @@ def index():
         selected_stations=selected_stations
     )
 
+def _requested_station_ids() -> List[str]:
+    """Station ids from repeated and/or comma-separated `stations` query params."""
+    station_ids: List[str] = []
+    for value in request.args.getlist('stations'):
+        station_ids.extend(part for part in value.split(',') if part.strip())
+    return station_ids
+
+
+@app.route('/api/arrivals')
+def arrivals_batch():
+    """Per-station payloads for many stations from one shared feed pass."""
+    requested = _requested_station_ids()
+    if len(requested) > BATCH_ENDPOINT_MAX_STATIONS:
+        return jsonify({
+            'status': 'error',
+            'message': f'At most {BATCH_ENDPOINT_MAX_STATIONS} stations per request',
+        }), 400
+
+    station_ids = [
+        station_id
+        for station_id in dict.fromkeys(raw_id.strip().upper() for raw_id in requested)
+        if is_valid_station(station_id)
+    ]
+    return jsonify({
+        'status': 'success',
+        'timestamp': datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC'),
+        'stations': get_train_status_batch(station_ids) if station_ids else {},
+    })
+
 if __name__ == '__main__':
+    configure_logging()
     app.run(host='0.0.0.0', port=5000, debug=True) 
@@ -12,7 +12,7 @@ from typing import Tuple, List, Optional, Dict, Sequence, Any
 
 sys.path.append('/home/hung/rpi-rgb-led-matrix/bindings/python')
 
-from rgbmatrix import RGBMatrix, RGBMatrixOptions, graphics
+from rgbmatrix import RGBMatrix, RGBMatrixOptions
 from PIL import Image
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -25,21 +25,49 @@ from mta_pi_led.services.board_config import (
     load_board_config,
     resolve_board_config_path,
 )
+from mta_pi_led.logging_config import configure_logging
+from mta_pi_led.services.arrival_times import led_label, minutes_until, next_minutes_change
+from mta_pi_led.services.background_refresher import BackgroundRefresher
+from mta_pi_led.services.bdf_font import BdfFont
+from mta_pi_led.services import board_layout
+from mta_pi_led.services.board_layout import (
+    BIKE_ICON,
+    EBIKE_ICON,
+    PANEL_SIZE,
+    render_name_strip,
+    render_text_tile,
+    text_box,
+)
 from mta_pi_led.services.citibike import get_station_data
 from mta_pi_led.services.display_scheduler import (
     DisplaySchedule,
     DisplayView,
     create_display_schedule,
 )
+from mta_pi_led.services.frame_cache import FrameCache
+from mta_pi_led.services.loop_deadlines import Deadline, next_deadline
+from mta_pi_led.services.raster import Bitmap
+from mta_pi_led.services.refresh_policy import AdaptiveRefreshScheduler, RefreshBounds
+from mta_pi_led.services.region_renderer import RegionRenderer
 
 # Import MTA data functions
-from app import get_train_status, get_train_status_batch
+from app import (
+    WatchPlan,
+    build_watch_plan,
+    get_train_status_batch,
+    invalidate_watch_plans,
+)
 from station_data import get_station_lines, is_valid_station, get_station_name
 
 CacheKey = Tuple[str, str]
-ArrivalCacheValue = Tuple[int, List[str], List[str]]
+# (cached_at, uptown epochs, downtown epochs); minutes are derived per tick.
+ArrivalCacheValue = Tuple[int, List[int], List[int]]
 StationFeedCacheValue = Tuple[int, Dict[str, Any]]
-RenderSignature = Tuple[str, str, Tuple[str, ...], Tuple[str, ...], str]
+StationPayloads = Dict[str, Dict[str, Any]]
+# (station, route, uptown labels, downtown labels, station name scroll offset in px)
+RenderSignature = Tuple[str, str, Tuple[str, ...], Tuple[str, ...], int]
+# Pre-rasterized station name and its scroll period in px (0 when it fits).
+StationNameStrip = Tuple[Image.Image, int]
 DIRECTION_LABELS = ("UPTOWN", "DOWNTOWN")
 
 
@@ -49,8 +77,7 @@ class Config:
     
     class Hardware:
         """LED matrix hardware settings"""
-        ROWS = 32
-        COLS = 64
+        COLS, ROWS = PANEL_SIZE
         BRIGHTNESS = 10
         MAPPING = 'adafruit-hat'
         GPIO_SLOWDOWN = 5
@@ -61,56 +88,27 @@ class Config:
         # Optional per-route icon path overrides.
         ROUTE_ICONS: Dict[str, str] = {}
     
-    class Layout:
-        """Display layout positions and sizes"""
-        ICON_SIZE = (18, 18)
-        ICON_POSITION = (1, 8)
-        
-        STATION_NAME_POSITION = (1, 6)
-        
-        # Uptown direction
-        UPTOWN_LABEL_POSITION = (22, 6)
-        UPTOWN_TIME_1_POSITION = (22, 12)
-        UPTOWN_TIME_2_POSITION = (36, 12)
-        UPTOWN_TIME_3_POSITION = (50, 12)
-        
-        # Downtown direction
-        DOWNTOWN_LABEL_POSITION = (22, 19)
-        DOWNTOWN_TIME_1_POSITION = (22, 25)
-        DOWNTOWN_TIME_2_POSITION = (36, 25)
-        DOWNTOWN_TIME_3_POSITION = (50, 25)
-        
-        # Time box dimensions
-        TIME_BOX_WIDTH = 12   # 3 chars × 4px per char = 12px
-        TIME_BOX_HEIGHT = 6   # Font height
-
-        # Bike icon position
-        BIKE_ICON_POSITION = (1, 26)
-        EBIKE_ICON_POSITION = (21, 26)
-
-        CHAR_WIDTH = 4
-        CHAR_HEIGHT = 6
-    
-    class Colors:
-        """RGB color definitions"""
-        WHITE = (255, 255, 255)
-        GREEN = (0, 255, 0)
-        YELLOW = (255, 255, 0)
-        RED = (255, 0, 0)
-        DAZZLING_BLUE = (57, 80, 160)
-        BLUE = (0, 0, 255)
+    # Geometry, colors and icons live in board_layout so tools can use
+    # them without the matrix driver.
+    Layout = board_layout.Layout
+    Colors = board_layout.Colors
 
-    
     class Display:
         """Display behavior settings"""
         ARRIVALS_PER_DIRECTION = 3  # Show 3 arrival times per direction
+        CACHED_ARRIVALS_PER_DIRECTION = 6  # Spare epochs backfill trains that pass between refreshes
         STATION_NAME_VISIBLE_CHARS = 5
-        STATION_NAME_SCROLL_GAP = 3
-        STATION_NAME_SCROLL_STEP_SECONDS = 0.22
+        STATION_NAME_SCROLL_GAP = 3  # Blank chars between repeats of a scrolling name
+        STATION_NAME_SCROLL_PIXEL_SECONDS = 0.055  # One pixel per step (~18 px/s)
         ROTATION_INTERVAL = 10
         REFRESH_INTERVAL = 30
-        UI_TICK_INTERVAL = 0.16
+        MIN_REFRESH_INTERVAL = 10  # Adaptive feed refresh bounds
+        MAX_REFRESH_INTERVAL = 120
+        UI_TICK_INTERVAL = 0.16  # Retry delay when the active view has nothing to show
+        MAX_IDLE_SECONDS = 1.0  # Longest the loop sleeps between deadlines
         TIME_MAX_CHARS = 3  # Max characters per time box
+        FRAME_CACHE_SIZE = 128  # Composited frames kept for reuse (~6 KiB each)
+        TILE_CACHE_SIZE = 256  # Rendered region tiles (station name steps, time labels)
     
     class MTA:
         """MTA station and route defaults"""
@@ -132,12 +130,13 @@ class RuntimeState:
     current_route: str
     next_rotation_ts: float
     last_config_reload_check_ts: int
-    last_station_feed_refresh_ts: int = 0
     last_citibike_fetch_ts: int = 0
     last_render_signature: Optional[RenderSignature] = None
     arrival_cache: Dict[CacheKey, ArrivalCacheValue] = field(default_factory=dict)
     station_feed_cache: Dict[str, StationFeedCacheValue] = field(default_factory=dict)
     unavailable_until: Dict[CacheKey, int] = field(default_factory=dict)
+    watch_plan: Optional[WatchPlan] = None
+    station_feed_generation: int = 0  # Newest refresher snapshot the loop has seen
 
 
 class MTALEDDisplay:
@@ -147,14 +146,21 @@ class MTALEDDisplay:
         self.station_id = self._validate_station(station_id)
         self.route_icon_cache: Dict[str, Image.Image] = {}
         self._station_scroll_station_id = self.station_id
-        self._station_scroll_index = 0
+        self._station_scroll_offset = 0
         self._station_scroll_last_update = time.time()
+        self._station_name_strips: Dict[str, StationNameStrip] = {}
         self._preload_route_icons()
         
         # Initialize hardware
         self.matrix = self._setup_matrix()
         self.canvas = self.matrix.CreateFrameCanvas()
-        self.font = self._load_font()
+        # Views are composited off-screen with the BDF font, then blitted.
+        self.frame_font = self._load_frame_font()
+        self.regions = RegionRenderer(
+            (Config.Hardware.COLS, Config.Hardware.ROWS),
+            tile_cache=FrameCache(Config.Display.TILE_CACHE_SIZE),
+            frame_cache=FrameCache(Config.Display.FRAME_CACHE_SIZE),
+        )
         
         print(f"✓ Display initialized for {get_station_name(self.station_id)} ({self.station_id})")
     
@@ -172,7 +178,7 @@ class MTALEDDisplay:
         if validated_station != self.station_id:
             self.station_id = validated_station
             self._station_scroll_station_id = self.station_id
-            self._station_scroll_index = 0
+            self._station_scroll_offset = 0
             self._station_scroll_last_update = time.time()
             print(
                 f"🔁 Switching station to {get_station_name(self.station_id)} "
@@ -192,11 +198,10 @@ class MTALEDDisplay:
         print("✓ LED matrix initialized")
         return matrix
     
-    def _load_font(self) -> Optional[graphics.Font]:
-        """Load display font"""
+    def _load_frame_font(self) -> Optional[BdfFont]:
+        """Load the display font for off-screen frame compositing"""
         try:
-            font = graphics.Font()
-            font.LoadFont(Config.Files.FONT)
+            font = BdfFont.load(self._resolve_asset_path(Config.Files.FONT))
             print("✓ Font loaded")
             return font
         except Exception as e:
@@ -274,16 +279,15 @@ class MTALEDDisplay:
             except Exception:
                 continue
 
-    def _display_line_logo(self, route: str, position: Tuple[int, int]) -> bool:
-        """Load and display route icon at specified position"""
+    def _get_route_icon(self, route: str) -> Optional[Image.Image]:
+        """Return the sized RGB route icon, loading it on first use."""
         route_key = (route or "").strip().upper()
         if route_key in self.route_icon_cache:
-            self.canvas.SetImage(self.route_icon_cache[route_key], position[0], position[1])
-            return True
+            return self.route_icon_cache[route_key]
 
         icon_candidates = self._get_route_icon_candidates(route)
         if not icon_candidates:
-            return False
+            return None
 
         last_error: Optional[Exception] = None
         resample_mode = self._get_resample_mode()
@@ -293,77 +297,86 @@ class MTALEDDisplay:
                 image = image.resize(Config.Layout.ICON_SIZE, resample_mode)
                 image = image.convert('RGB')
                 self.route_icon_cache[route_key] = image
-                self.canvas.SetImage(image, position[0], position[1])
-                return True
+                return image
             except Exception as exc:
                 last_error = exc
                 continue
 
         if last_error is not None:
             print(f"✗ Error displaying route icon for {route}: {last_error}")
-        return False
-
-    def _draw_route_fallback(self, route: str):
-        """Draw route text when no icon asset exists."""
-        text = route[:2].upper()
-        x = Config.Layout.ICON_POSITION[0] + 2
-        y = Config.Layout.ICON_POSITION[1] + Config.Layout.CHAR_HEIGHT
-        self._draw_text(text, (x, y), Config.Colors.WHITE)
+        return None
 
-    def _get_station_name_window(self) -> str:
-        """Get station name text window; scroll if it exceeds visible width."""
+    def _get_station_name_strip(self) -> StationNameStrip:
+        """Rasterize the station name once into a strip wide enough to scroll through."""
         station_name = get_station_name(self.station_id)
-        visible_chars = Config.Display.STATION_NAME_VISIBLE_CHARS
+        cached = self._station_name_strips.get(station_name)
+        if cached is not None:
+            return cached
+
+        strip = render_name_strip(
+            self.frame_font,
+            station_name,
+            Config.Display.STATION_NAME_VISIBLE_CHARS * Config.Layout.CHAR_WIDTH,
+            max(1, Config.Display.STATION_NAME_SCROLL_GAP) * Config.Layout.CHAR_WIDTH,
+        )
+        self._station_name_strips[station_name] = strip
+        return strip
+
+    def _get_station_name_offset(self) -> int:
+        """Get station name scroll offset in pixels; 0 unless the name exceeds visible width."""
+        _, period = self._get_station_name_strip()
         if self._station_scroll_station_id != self.station_id:
             self._station_scroll_station_id = self.station_id
-            self._station_scroll_index = 0
+            self._station_scroll_offset = 0
             self._station_scroll_last_update = time.time()
 
-        if len(station_name) <= visible_chars:
-            self._station_scroll_index = 0
+        if not period:
+            self._station_scroll_offset = 0
             self._station_scroll_last_update = time.time()
-            return station_name
-
-        gap = max(1, Config.Display.STATION_NAME_SCROLL_GAP)
-        scroll_step = max(0.1, Config.Display.STATION_NAME_SCROLL_STEP_SECONDS)
-        cycle_text = station_name + (" " * gap)
+            return 0
 
+        scroll_step = max(0.01, Config.Display.STATION_NAME_SCROLL_PIXEL_SECONDS)
         now = time.time()
         elapsed = now - self._station_scroll_last_update
         if elapsed >= scroll_step:
             steps = int(elapsed / scroll_step)
-            self._station_scroll_index = (self._station_scroll_index + steps) % len(cycle_text)
+            self._station_scroll_offset = (self._station_scroll_offset + steps) % period
             self._station_scroll_last_update += steps * scroll_step
+        return self._station_scroll_offset
 
-        rolling_text = cycle_text + cycle_text
-        return rolling_text[self._station_scroll_index : self._station_scroll_index + visible_chars]
+    def next_station_scroll_ts(self) -> Optional[float]:
+        """When the station name moves its next pixel; None when it does not scroll."""
+        _, period = self._get_station_name_strip()
+        if not period:
+            return None
+        return self._station_scroll_last_update + max(0.01, Config.Display.STATION_NAME_SCROLL_PIXEL_SECONDS)
+
+    def _set_station_name_region(self, offset: int):
+        """Place the visible window of the station name strip."""
+        strip, _ = self._get_station_name_strip()
+        box = text_box(
+            Config.Layout.STATION_NAME_POSITION,
+            Config.Display.STATION_NAME_VISIBLE_CHARS * Config.Layout.CHAR_WIDTH,
+        )
+        self.regions.set_region(
+            "station_name",
+            box,
+            (get_station_name(self.station_id), offset),
+            lambda: strip.crop((offset, 0, offset + box[2], box[3])),
+        )
     
     def _format_single_time(self, time_str: str) -> str:
-        """Format a single arrival time to fit in 3 characters"""
-        if not time_str or time_str == 'No data':
+        """Return the label for one time box; labels arrive pre-formatted for the LED."""
+        if not time_str:
             return '---'
-        
-        # Convert "2 min" → "2m", "Now" → "NOW"
-        formatted = time_str.replace(' min', 'm').replace('Now', 'NOW')
-        
-        # If longer than 3 chars (e.g., "127m"), remove the 'm'
-        if len(formatted) > Config.Display.TIME_MAX_CHARS:
-            formatted = formatted.replace('m', '')[:Config.Display.TIME_MAX_CHARS]
-        
-        return formatted
-    
-    def _draw_text(self, text: str, position: Tuple[int, int], color: Tuple[int, int, int]):
-        """Draw text at specified position with color"""
-        if self.font:
-            graphics.DrawText(self.canvas, self.font, position[0], position[1], 
-                            graphics.Color(*color), text)
+        return time_str[:Config.Display.TIME_MAX_CHARS]
     
     def get_realtime_data(
         self,
         routes: Sequence[str],
-        station_data: Optional[Dict[str, Any]] = None,
-    ) -> Tuple[Optional[str], List[str], List[str]]:
-        """Fetch real-time MTA data for preferred routes"""
+        station_data: Dict[str, Any],
+    ) -> Tuple[Optional[str], List[int], List[int]]:
+        """Return (route, uptown epochs, downtown epochs) for preferred routes"""
         if isinstance(routes, str):
             routes_to_check = [routes]
         else:
@@ -375,13 +388,6 @@ class MTALEDDisplay:
         
         try:
             data = station_data
-            if data is None:
-                print(
-                    f"🔄 Refreshing station feed for "
-                    f"{get_station_name(self.station_id)}..."
-                )
-                data = get_train_status(self.station_id)
-            
             if data.get('status') != 'success':
                 print("✗ Train API returned error status")
                 return None, [], []
@@ -395,15 +401,19 @@ class MTALEDDisplay:
                     continue
                 
                 route_data = trains[route]
-                uptown = route_data.get('uptown', {}).get('next_arrivals', [])
-                downtown = route_data.get('downtown', {}).get('next_arrivals', [])
+                uptown = route_data.get('uptown', {}).get('arrival_times', [])
+                downtown = route_data.get('downtown', {}).get('arrival_times', [])
                 
                 if fallback_route is None:
                     fallback_route = route
                     fallback_times = (uptown, downtown)
                 
                 if uptown or downtown:
-                    print(f"✓ {route} Uptown: {uptown} | Downtown: {downtown}")
+                    now_ts = int(time.time())
+                    print(
+                        f"✓ {route} Uptown: {format_led_arrivals(uptown, now_ts)} | "
+                        f"Downtown: {format_led_arrivals(downtown, now_ts)}"
+                    )
                     return route, uptown, downtown
                 else:
                     print(f"⚠️ {route} listed but no arrivals reported")
@@ -419,158 +429,148 @@ class MTALEDDisplay:
             print(f"✗ Error: {e}")
             return None, [], []
     
-    def _draw_station_info(self, route: str, station_name_window: Optional[str] = None):
-        """Draw station information: line logo + station name"""
-        # Clear header regions so station/route updates do not leave stale pixels.
-        self.clear_area(Config.Layout.ICON_POSITION, Config.Layout.ICON_SIZE)
-        station_clear_width = Config.Display.STATION_NAME_VISIBLE_CHARS * Config.Layout.CHAR_WIDTH
-        station_clear_top = max(
-            0,
-            Config.Layout.STATION_NAME_POSITION[1] - Config.Layout.CHAR_HEIGHT - 1,
-        )
-        station_clear_height = Config.Layout.CHAR_HEIGHT + 2
-        self.clear_area(
-            (
-                Config.Layout.STATION_NAME_POSITION[0],
-                station_clear_top,
-            ),
-            (station_clear_width, station_clear_height),
+    def draw_citibike_icons(self):
+        """Place Citi Bike icons (not shown by default); drawn with the next frame"""
+        for name, bitmap, position in (
+            ("bike_icon", BIKE_ICON, Config.Layout.BIKE_ICON_POSITION),
+            ("ebike_icon", EBIKE_ICON, Config.Layout.EBIKE_ICON_POSITION),
+        ):
+            self._set_bitmap_region(name, bitmap, position, Config.Colors.DAZZLING_BLUE)
+
+    def show_citibike_status(self, data: Dict):
+        """Place Citi Bike counters; drawn with the next frame"""
+        num_normal_bikes = max(0, data.get('num_bikes_available', 0) - data.get('num_ebikes_available', 0))
+        num_ebikes = max(0, data.get('num_ebikes_available', 0))
+
+        bike_time_position = (Config.Layout.BIKE_ICON_POSITION[0] + 11, Config.Layout.BIKE_ICON_POSITION[1] + 6)
+        ebike_time_position = (Config.Layout.EBIKE_ICON_POSITION[0] + 5, Config.Layout.EBIKE_ICON_POSITION[1] + 6)
+        counter_width = Config.Layout.CHAR_WIDTH * 2
+
+        self._set_text_region("bike_count", f"{num_normal_bikes}", bike_time_position, counter_width,
+                              Config.Colors.BLUE if num_normal_bikes > 0 else Config.Colors.RED)
+        self._set_text_region("ebike_count", f"{num_ebikes}", ebike_time_position, counter_width,
+                              Config.Colors.BLUE if num_ebikes > 0 else Config.Colors.RED)
+
+    def _set_bitmap_region(
+        self,
+        name: str,
+        bitmap: Bitmap,
+        position: Tuple[int, int],
+        color: Tuple[int, int, int],
+    ):
+        """Place a precomputed icon bitmap in its own region."""
+        self.regions.set_region(name, position + bitmap.size, color, lambda: bitmap.tile(color))
+
+    def _set_text_region(
+        self,
+        name: str,
+        text: str,
+        position: Tuple[int, int],
+        width: int,
+        color: Tuple[int, int, int],
+    ):
+        """Place one line of text in its own region, keyed by text and color."""
+        box = text_box(position, width)
+        self.regions.set_region(
+            name,
+            box,
+            (text, color),
+            lambda: render_text_tile(self.frame_font, box, position, color, text),
         )
 
-        # Line logo (e.g., F train icon). If no asset exists, draw route text.
-        if not self._display_line_logo(route, Config.Layout.ICON_POSITION):
+    def _set_icon_region(self, route: str):
+        """Place the route icon, or its text fallback, in the icon region."""
+
+        def render() -> Image.Image:
+            icon = self._get_route_icon(route)
+            if icon is not None:
+                return icon
             print(f"⚠️ Icon unavailable for route {route}; using text fallback")
-            self._draw_route_fallback(route)
+            tile = Image.new('RGB', Config.Layout.ICON_SIZE)
+            if self.frame_font:
+                self.frame_font.draw_text(tile, (2, Config.Layout.CHAR_HEIGHT), Config.Colors.WHITE, route[:2].upper())
+            return tile
+
+        self.regions.set_region(
+            "icon",
+            Config.Layout.ICON_POSITION + Config.Layout.ICON_SIZE,
+            route,
+            render,
+        )
 
-        # Station name (scrolling window for long names)
-        if station_name_window is None:
-            station_name_window = self._get_station_name_window()
-        self._draw_text(
-            station_name_window,
-            Config.Layout.STATION_NAME_POSITION,
+    def _set_direction_regions(
+        self,
+        direction: str,
+        label: str,
+        label_position: Tuple[int, int],
+        times: List[str],
+        time_positions: Sequence[Tuple[int, int]],
+        color: Tuple[int, int, int],
+    ):
+        """Place one direction label and its time boxes, one region per box."""
+        self._set_text_region(
+            f"{direction}_label",
+            label,
+            label_position,
+            Config.Hardware.COLS - label_position[0],
             Config.Colors.WHITE,
         )
-    
-    def clear_area(self, position: Tuple[int, int], size: Tuple[int, int]):
-        """Clear an area of the canvas"""
-        for col in range(position[0], position[0] + size[0]):
-            for row in range(position[1], position[1] + size[1]):
-                if 0 <= col < Config.Hardware.COLS and 0 <= row < Config.Hardware.ROWS:
-                    self.canvas.SetPixel(col, row, 0, 0, 0)
-    
-    def _draw_direction_label(self, direction_name: str, label_position: Tuple[int, int]):
-        """Draw direction label (static)"""
-        self._draw_text(direction_name, label_position, Config.Colors.WHITE)
-    
-    def _draw_time_box(self, time_str: str, position: Tuple[int, int], color: Tuple[int, int, int]):
-        """Draw a single arrival time in its box (clear + draw)"""
-        # Clear the box first
-        self.clear_area([position[0], position[1] - Config.Layout.CHAR_HEIGHT], [Config.Layout.TIME_BOX_WIDTH, Config.Layout.TIME_BOX_HEIGHT])
-        
-        # Format and draw the time
-        formatted_time = self._format_single_time(time_str)
-        self._draw_text(formatted_time, position, color)
-    
-    def show_arrival_times(self, times: List[str], box_positions: List[Tuple[int, int]], color: Tuple[int, int, int]):
-        """Draw all arrival times for one direction (updates 3 boxes)"""
-        # Ensure we have exactly 3 times (pad with empty if needed)
-        padded_times = (times + [''] * Config.Display.ARRIVALS_PER_DIRECTION)[:Config.Display.ARRIVALS_PER_DIRECTION]
-        
-        # Draw each time in its own box
-        for time_str, position in zip(padded_times, box_positions):
-            self._draw_time_box(time_str, position, color)
-
-    def _draw_bike(self, position: Tuple[int, int], color: Tuple[int, int, int]):
-        """Draw a 6x10 bike """
-        x, y = position
-        
-        icon_pattern = [
-            [0, 1, 1, 1, 0, 0, 0, 0, 0, 0],  
-            [0, 0, 1, 0, 1, 1, 0, 0, 0, 0], 
-            [0, 1, 1, 0, 0, 1, 0, 1, 1, 0], 
-            [1, 0, 0, 1, 1, 1, 1, 0, 0, 1], 
-            [1, 0, 0, 1, 0, 0, 1, 0, 0, 1], 
-            [0, 1, 1, 0, 0, 0, 0, 1, 1, 0]   
-        ]
-        
-        for row in range(len(icon_pattern)):
-            for col in range(len(icon_pattern[row])):
-                if icon_pattern[row][col] == 1:
-                    self.canvas.SetPixel(x + col, y + row, color[0], color[1], color[2])
-
-    def _draw_ebike(self, position: Tuple[int, int], color: Tuple[int, int, int]):
-        """Draw a plug indicator"""
-        x, y = position
-        
-        icon_pattern = [
-            [0, 0, 1, 0],
-            [0, 1, 0, 0], 
-            [1, 1, 1, 1],  
-            [0, 0, 1, 0],  
-            [0, 1, 0, 0],  
-            [1, 0, 0, 0]   
-        ]
-        
-        for row in range(len(icon_pattern)):
-            for col in range(len(icon_pattern[row])):
-                if icon_pattern[row][col] == 1:
-                    self.canvas.SetPixel(x + col, y + row, color[0], color[1], color[2])
+        slots = Config.Display.ARRIVALS_PER_DIRECTION
+        padded_times = (times + [''] * slots)[:slots]
+        for index, (time_str, position) in enumerate(zip(padded_times, time_positions), start=1):
+            self._set_text_region(
+                f"{direction}_time_{index}",
+                self._format_single_time(time_str),
+                position,
+                Config.Layout.TIME_BOX_WIDTH,
+                color,
+            )
 
-    def show_mta_station_info(
+    def show_mta_frame(
         self,
         route: str,
         directions: Sequence[str],
-        station_name_window: Optional[str] = None,
+        station_name_offset: int,
+        uptown_times: List[str],
+        downtown_times: List[str],
     ):
-        """Show MTA station info"""
+        """Show an MTA view, blitting only layout regions whose content changed."""
+        self._set_icon_region(route)
+        self._set_station_name_region(station_name_offset)
+
+        self._set_direction_regions(
+            "uptown",
+            directions[0],
+            Config.Layout.UPTOWN_LABEL_POSITION,
+            uptown_times,
+            (
+                Config.Layout.UPTOWN_TIME_1_POSITION,
+                Config.Layout.UPTOWN_TIME_2_POSITION,
+                Config.Layout.UPTOWN_TIME_3_POSITION,
+            ),
+            Config.Colors.GREEN,
+        )
+        self._set_direction_regions(
+            "downtown",
+            directions[1],
+            Config.Layout.DOWNTOWN_LABEL_POSITION,
+            downtown_times,
+            (
+                Config.Layout.DOWNTOWN_TIME_1_POSITION,
+                Config.Layout.DOWNTOWN_TIME_2_POSITION,
+                Config.Layout.DOWNTOWN_TIME_3_POSITION,
+            ),
+            Config.Colors.YELLOW,
+        )
 
-        self._draw_station_info(route, station_name_window=station_name_window)
-        self._draw_direction_label(directions[0], Config.Layout.UPTOWN_LABEL_POSITION)
-        self._draw_direction_label(directions[1], Config.Layout.DOWNTOWN_LABEL_POSITION)
-    
-    def show_mta_arrival_times(self, route: str, uptown_times: List[str], downtown_times: List[str]):
-        """Display complete MTA board with all components"""
-        
-        # Dynamic: Update only arrival times (every refresh) - 6 individual boxes
-        uptown_positions = [
-            Config.Layout.UPTOWN_TIME_1_POSITION,
-            Config.Layout.UPTOWN_TIME_2_POSITION,
-            Config.Layout.UPTOWN_TIME_3_POSITION
-        ]
-        downtown_positions = [
-            Config.Layout.DOWNTOWN_TIME_1_POSITION,
-            Config.Layout.DOWNTOWN_TIME_2_POSITION,
-            Config.Layout.DOWNTOWN_TIME_3_POSITION
-        ]
-        
-        self.show_arrival_times(uptown_times, uptown_positions, Config.Colors.GREEN)
-        self.show_arrival_times(downtown_times, downtown_positions, Config.Colors.YELLOW)
-        
-        # Update display
+        self.regions.present(self.canvas)
         self.canvas = self.matrix.SwapOnVSync(self.canvas)
-        
-    def draw_citibike_icons(self):
-        """Draw Citi Bike icons (not shown by default)"""
-        self._draw_bike(Config.Layout.BIKE_ICON_POSITION, Config.Colors.DAZZLING_BLUE)
-        self._draw_ebike(Config.Layout.EBIKE_ICON_POSITION, Config.Colors.DAZZLING_BLUE)
-
-    def show_citibike_status(self, data: Dict):
-        """Show Cibike status"""
-        num_normal_bikes = max(0, data.get('num_bikes_available', 0) - data.get('num_ebikes_available', 0))
-        num_ebikes = max(0, data.get('num_ebikes_available', 0))
-
-        bike_time_position = [Config.Layout.BIKE_ICON_POSITION[0] + 11, Config.Layout.BIKE_ICON_POSITION[1] + 6]
-        ebike_time_position = [Config.Layout.EBIKE_ICON_POSITION[0] + 5, Config.Layout.EBIKE_ICON_POSITION[1] + 6]
 
-        self.clear_area([bike_time_position[0], bike_time_position[1] - 6], [Config.Layout.CHAR_WIDTH * 2, Config.Layout.CHAR_HEIGHT])
-        self.clear_area([ebike_time_position[0], ebike_time_position[1] - 6], [Config.Layout.CHAR_WIDTH * 2, Config.Layout.CHAR_HEIGHT])
-        self._draw_text(f"{num_normal_bikes}", bike_time_position,  Config.Colors.BLUE if num_normal_bikes > 0 else Config.Colors.RED)
-        self._draw_text(f"{num_ebikes}", ebike_time_position, Config.Colors.BLUE if num_ebikes > 0 else Config.Colors.RED)
-    
     def clear(self):
         """Clear the display"""
         self.canvas.Clear()
         self.canvas = self.matrix.SwapOnVSync(self.canvas)
+        self.regions.invalidate()
 
 
 def apply_board_config(board_config: BoardConfig):
@@ -585,6 +585,8 @@ def apply_board_config(board_config: BoardConfig):
         Config.MTA.STATION = selected_station
 
     Config.Display.REFRESH_INTERVAL = board_config.refresh_seconds
+    Config.Display.MIN_REFRESH_INTERVAL = board_config.min_refresh_seconds
+    Config.Display.MAX_REFRESH_INTERVAL = board_config.max_refresh_seconds
     Config.Display.ROTATION_INTERVAL = board_config.rotation_seconds
     Config.CitiBike.STATION_ID = board_config.citibike_station_id
 
@@ -663,6 +665,20 @@ def should_run_interval(last_run_ts: int, now_ts: int, interval_seconds: int) ->
     return (now_ts - last_run_ts) >= interval_seconds
 
 
+def upcoming_arrivals(arrival_times: Sequence[int], now_ts: int) -> List[int]:
+    """Drop arrival epochs that have already passed."""
+    return [arrival_time for arrival_time in arrival_times if arrival_time > now_ts]
+
+
+def format_led_arrivals(arrival_times: Sequence[int], now_ts: int) -> List[str]:
+    """Format the next arrivals as 3-char labels using the current clock."""
+    upcoming = upcoming_arrivals(arrival_times, now_ts)[:Config.Display.ARRIVALS_PER_DIRECTION]
+    return [
+        led_label(minutes, Config.Display.TIME_MAX_CHARS)
+        for minutes in minutes_until(upcoming, now_ts)
+    ]
+
+
 def is_cache_stale(
     cached_arrivals: Optional[ArrivalCacheValue], now_ts: int
 ) -> bool:
@@ -704,41 +720,144 @@ def _preferred_routes_by_station(schedule: DisplaySchedule) -> Dict[str, List[st
     return routes_by_station
 
 
-def maybe_refresh_station_feeds(state: RuntimeState, now_ts: int):
-    """Refresh all configured station feeds once per refresh interval."""
-    if not should_run_interval(
-        state.last_station_feed_refresh_ts,
-        now_ts,
-        Config.Display.REFRESH_INTERVAL,
-    ):
+def displayed_view_keys(state: RuntimeState) -> List[Tuple[str, str]]:
+    """(station, route) of the view on the panel; read from the refresh worker."""
+    views = state.schedule.views
+    active_index = state.active_index
+    if not 0 <= active_index < len(views):
+        return []
+    view = views[active_index]
+    return [(view.station_id, view.route_id)]
+
+
+def create_refresh_scheduler(state: RuntimeState) -> AdaptiveRefreshScheduler:
+    """Adaptive feed refresh cadence bounded by board.json settings."""
+    return AdaptiveRefreshScheduler(
+        bounds=lambda: RefreshBounds(
+            base_seconds=Config.Display.REFRESH_INTERVAL,
+            min_seconds=Config.Display.MIN_REFRESH_INTERVAL,
+            max_seconds=Config.Display.MAX_REFRESH_INTERVAL,
+        ),
+        displayed_views=lambda: displayed_view_keys(state),
+    )
+
+
+def create_station_feed_refresher(
+    refresh_scheduler: AdaptiveRefreshScheduler,
+) -> BackgroundRefresher[StationPayloads]:
+    """Create the worker that owns all subway feed network I/O."""
+    return BackgroundRefresher(
+        name="station-feed-refresher",
+        interval_seconds=refresh_scheduler.interval_seconds,
+    )
+
+
+def ensure_station_feed_job(
+    state: RuntimeState,
+    refresher: BackgroundRefresher[StationPayloads],
+    refresh_scheduler: AdaptiveRefreshScheduler,
+):
+    """Point the refresher at the current schedule's watch plan."""
+    if state.watch_plan is not None:
         return
 
     station_ids = _schedule_station_ids(state.schedule)
     if not station_ids:
-        state.last_station_feed_refresh_ts = now_ts
         return
 
-    preferred_routes = _preferred_routes_by_station(state.schedule)
+    watch_plan = build_watch_plan(
+        station_ids,
+        _preferred_routes_by_station(state.schedule),
+        arrivals_per_direction=Config.Display.CACHED_ARRIVALS_PER_DIRECTION,
+    )
+    state.watch_plan = watch_plan
     station_labels = ", ".join(
-        f"{get_station_name(station_id)} ({station_id})" for station_id in station_ids
+        f"{get_station_name(station_id)} ({station_id})"
+        for station_id in watch_plan.station_ids
     )
-    print(f"🔄 Refreshing station feeds: {station_labels}")
 
-    station_payloads = get_train_status_batch(
-        station_ids,
-        preferred_routes_by_station=preferred_routes,
+    def _fetch() -> StationPayloads:
+        print(f"🔄 Refreshing station feeds: {station_labels}")
+        payloads = get_train_status_batch(watch_plan.station_ids, watch_plan=watch_plan)
+        data_age = max(
+            (payload.get('data_age_seconds', 0) for payload in payloads.values()),
+            default=0,
+        )
+        if data_age:
+            print(f"⚠️ Showing last good feed data ({data_age}s old) while feeds recover")
+        next_interval = refresh_scheduler.observe(payloads)
+        print(f"⏱️ Next station feed refresh in {next_interval:.0f}s")
+        return payloads
+
+    refresh_scheduler.reset()
+    refresher.set_job(watch_plan, _fetch)
+
+
+def _route_arrival_times(
+    station_payload: Optional[Dict[str, Any]],
+    route_id: str,
+) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    if not station_payload or station_payload.get('status') != 'success':
+        return (), ()
+    route_data = station_payload.get('trains', {}).get(route_id, {})
+    return (
+        tuple(route_data.get('uptown', {}).get('arrival_times', [])),
+        tuple(route_data.get('downtown', {}).get('arrival_times', [])),
     )
 
-    state.station_feed_cache.clear()
-    for station_id in station_ids:
-        station_payload = station_payloads.get(station_id)
-        if station_payload is None:
-            continue
-        state.station_feed_cache[station_id] = (now_ts, station_payload)
 
-    state.last_station_feed_refresh_ts = now_ts
-    state.arrival_cache.clear()
-    state.unavailable_until.clear()
+def changed_station_routes(
+    previous_payload: Optional[Dict[str, Any]],
+    station_payload: Dict[str, Any],
+) -> List[str]:
+    """Return routes whose arrival epochs differ between two station payloads."""
+    routes = set((previous_payload or {}).get('trains', {})) | set(station_payload.get('trains', {}))
+    return sorted(
+        route
+        for route in routes
+        if _route_arrival_times(previous_payload, route)
+        != _route_arrival_times(station_payload, route)
+    )
+
+
+def maybe_apply_station_feeds(
+    state: RuntimeState,
+    refresher: BackgroundRefresher[StationPayloads],
+):
+    """Swap in the refresher's latest snapshot if it is new for this plan."""
+    snapshot = refresher.latest()
+    if snapshot is None or snapshot.generation == state.station_feed_generation:
+        return
+    # Seen even when discarded, so the loop only wakes for newer snapshots.
+    state.station_feed_generation = snapshot.generation
+    if snapshot.job_key is not state.watch_plan:
+        return
+
+    refreshed_ts = int(snapshot.refreshed_at)
+    for station_id in list(state.station_feed_cache):
+        if station_id not in snapshot.value:
+            del state.station_feed_cache[station_id]
+
+    changed_views: List[CacheKey] = []
+    for station_id, station_payload in snapshot.value.items():
+        cached_station_feed = state.station_feed_cache.get(station_id)
+        previous_payload = cached_station_feed[1] if cached_station_feed else None
+        changed_routes = changed_station_routes(previous_payload, station_payload)
+        if (
+            cached_station_feed is None
+            or changed_routes
+            or previous_payload.get('status') != station_payload.get('status')
+        ):
+            state.station_feed_cache[station_id] = (refreshed_ts, station_payload)
+        changed_views.extend((station_id, route) for route in changed_routes)
+
+    # Only views whose arrivals changed lose their cached arrivals and cooldown;
+    # everything else keeps rendering from what it already has.
+    for cache_key in changed_views:
+        state.arrival_cache.pop(cache_key, None)
+        state.unavailable_until.pop(cache_key, None)
+    if changed_views:
+        print(f"🔁 Arrivals changed for {len(changed_views)} view(s)")
 
 
 def refresh_view_arrivals(
@@ -748,8 +867,8 @@ def refresh_view_arrivals(
     arrival_cache: Dict[CacheKey, ArrivalCacheValue],
     station_feed_cache: Dict[str, StationFeedCacheValue],
     unavailable_until: Dict[CacheKey, int],
-) -> Tuple[List[str], List[str], bool]:
-    """Refresh arrivals for active view; return times and availability."""
+) -> Tuple[List[int], List[int], bool]:
+    """Refresh arrival epochs for active view; return them and availability."""
     station_data = get_station_feed_data(display, station_feed_cache)
     if station_data is None:
         print(
@@ -764,6 +883,8 @@ def refresh_view_arrivals(
         )
     if not route:
         uptown, downtown = [], []
+    uptown = upcoming_arrivals(uptown, now_ts)
+    downtown = upcoming_arrivals(downtown, now_ts)
 
     cache_key = (display.station_id, current_route)
     if not uptown and not downtown:
@@ -818,6 +939,7 @@ def reload_runtime_config(
     arrival_cache.clear()
     station_feed_cache.clear()
     unavailable_until.clear()
+    invalidate_watch_plans()
 
     next_index = get_available_view_index(
         schedule=reloaded_schedule,
@@ -862,9 +984,10 @@ def maybe_reload_board_config(
 
     state.schedule = reloaded_schedule
     state.active_index = reloaded_index
+    # A new watch plan is built next tick and handed to the refresher.
+    state.watch_plan = None
     state.next_rotation_ts = now + state.schedule.interval_seconds
     state.last_render_signature = None
-    state.last_station_feed_refresh_ts = 0
 
 
 def maybe_rotate_display_view(state: RuntimeState, now: float, now_ts: int):
@@ -900,11 +1023,14 @@ def get_arrivals_for_active_view(
     state: RuntimeState,
     now: float,
     now_ts: int,
-) -> Optional[Tuple[List[str], List[str]]]:
-    """Return arrivals for active view or None when view should be skipped."""
+) -> Optional[Tuple[List[int], List[int]]]:
+    """Return arrival epochs for active view or None when view should be skipped."""
     cache_key = (display.station_id, state.current_route)
     cached_arrivals = state.arrival_cache.get(cache_key)
-    if is_cache_stale(cached_arrivals, now_ts):
+    if is_cache_stale(cached_arrivals, now_ts) or not (
+        upcoming_arrivals(cached_arrivals[1], now_ts)
+        or upcoming_arrivals(cached_arrivals[2], now_ts)
+    ):
         uptown, downtown, has_arrivals = refresh_view_arrivals(
             display=display,
             current_route=state.current_route,
@@ -938,26 +1064,73 @@ def maybe_render_view(
     downtown: List[str],
 ):
     """Render view only when content changes."""
-    station_name_window = display._get_station_name_window()
+    station_name_offset = display._get_station_name_offset()
     render_signature = (
         display.station_id,
         state.current_route,
         tuple(uptown),
         tuple(downtown),
-        station_name_window,
+        station_name_offset,
     )
     if render_signature == state.last_render_signature:
         return
 
-    display.show_mta_station_info(
+    display.show_mta_frame(
         state.current_route,
         DIRECTION_LABELS,
-        station_name_window=station_name_window,
+        station_name_offset,
+        uptown,
+        downtown,
     )
-    display.show_mta_arrival_times(state.current_route, uptown, downtown)
     state.last_render_signature = render_signature
 
 
+def next_loop_deadline(
+    display: MTALEDDisplay,
+    state: RuntimeState,
+    now: float,
+    arrivals: Optional[Tuple[List[int], List[int]]],
+) -> Deadline:
+    """Earliest time the loop has work: scroll step, countdown change, rotation, config check."""
+    now_ts = int(now)
+    refresh_interval = Config.Display.REFRESH_INTERVAL
+    candidates: Dict[str, Optional[float]] = {
+        "rotation": state.next_rotation_ts,
+        "config check": state.last_config_reload_check_ts + refresh_interval,
+    }
+    if Config.CitiBike.ENABLED:
+        candidates["citibike"] = state.last_citibike_fetch_ts + refresh_interval
+
+    if arrivals is None:
+        # The active view was skipped; try the next one shortly.
+        candidates["view retry"] = now + Config.Display.UI_TICK_INTERVAL
+    else:
+        candidates["scroll"] = display.next_station_scroll_ts()
+        visible_arrivals = [
+            arrival_time
+            for times in arrivals
+            for arrival_time in upcoming_arrivals(times, now_ts)[:Config.Display.ARRIVALS_PER_DIRECTION]
+        ]
+        candidates["countdown"] = next_minutes_change(visible_arrivals, now_ts)
+        cached_arrivals = state.arrival_cache.get((display.station_id, state.current_route))
+        if cached_arrivals is not None:
+            candidates["arrival cache"] = cached_arrivals[0] + refresh_interval
+
+    return next_deadline(now, candidates, Config.Display.MAX_IDLE_SECONDS)
+
+
+def wait_for_next_deadline(
+    refresher: BackgroundRefresher[StationPayloads],
+    state: RuntimeState,
+    deadline: Deadline,
+):
+    """Sleep until the deadline, waking early for feeds newer than the loop has seen."""
+    refresher.wait_for_newer(
+        state.station_feed_generation,
+        timeout=deadline.seconds_left(time.time()),
+    )
+
+
 def maybe_refresh_citibike(now_ts: int, state: RuntimeState):
     """Refresh Citi Bike data on refresh cadence."""
     if not Config.CitiBike.ENABLED:
@@ -979,6 +1152,7 @@ def maybe_refresh_citibike(now_ts: int, state: RuntimeState):
 
 def main():
     """Run real-time MTA display"""
+    configure_logging()
     config_path = resolve_board_config_path()
     board_config = load_board_config(config_path)
     apply_board_config(board_config)
@@ -1000,7 +1174,8 @@ def main():
 
     print(
         f"🚇 Starting MTA display scheduler @ {schedule.interval_seconds}s "
-        f"rotation, {Config.Display.REFRESH_INTERVAL}s refresh"
+        f"rotation, {Config.Display.REFRESH_INTERVAL}s refresh "
+        f"(adaptive {Config.Display.MIN_REFRESH_INTERVAL}-{Config.Display.MAX_REFRESH_INTERVAL}s)"
     )
     display = MTALEDDisplay(active_view.station_id)
     start_ts = time.time()
@@ -1016,6 +1191,13 @@ def main():
         f"🧩 Hot reload enabled for {config_path} "
         f"(every {Config.Display.REFRESH_INTERVAL}s refresh)"
     )
+    refresh_scheduler = create_refresh_scheduler(state)
+    station_feed_refresher = create_station_feed_refresher(refresh_scheduler)
+    ensure_station_feed_job(state, station_feed_refresher, refresh_scheduler)
+    # Block once at startup so the first frame has data; later refreshes run
+    # on the worker thread (repeat fetches within the feed cache TTL are free).
+    station_feed_refresher.refresh_once()
+    station_feed_refresher.start()
     
     try:
         display.clear()
@@ -1025,24 +1207,34 @@ def main():
             now_ts = int(now)
 
             maybe_reload_board_config(config_path, state, now, now_ts)
-            maybe_refresh_station_feeds(state, now_ts)
+            ensure_station_feed_job(state, station_feed_refresher, refresh_scheduler)
+            maybe_apply_station_feeds(state, station_feed_refresher)
             maybe_rotate_display_view(state, now, now_ts)
             sync_display_view(display, state)
 
             arrivals = get_arrivals_for_active_view(display, state, now, now_ts)
-            if arrivals is None:
-                time.sleep(Config.Display.UI_TICK_INTERVAL)
-                continue
-            uptown, downtown = arrivals
+            if arrivals is not None:
+                # Minutes come from the current clock, so labels tick down
+                # between feed refreshes without another fetch.
+                uptown = format_led_arrivals(arrivals[0], now_ts)
+                downtown = format_led_arrivals(arrivals[1], now_ts)
 
-            maybe_render_view(display, state, uptown, downtown)
+                maybe_render_view(display, state, uptown, downtown)
             maybe_refresh_citibike(now_ts, state)
 
-            time.sleep(max(0.2, Config.Display.UI_TICK_INTERVAL))
+            # Sleep until the next scroll step, countdown change, rotation or
+            # config check is due, instead of polling on a fixed tick.
+            wait_for_next_deadline(
+                station_feed_refresher,
+                state,
+                next_loop_deadline(display, state, now, arrivals),
+            )
             
     except KeyboardInterrupt:
         display.clear()
         print(f"\n🛑 Display stopped.")
+    finally:
+        station_feed_refresher.stop(timeout=1)
 
 
 if __name__ == "__main__":
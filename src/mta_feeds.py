@@ -1,15 +1,23 @@
-# MTA GTFS-realtime feed URLs
-FEEDS = {
-    'ace': 'https://api-endpoint.mta.info/Dataservice/mtagtfsfeeds/nyct%2Fgtfs-ace',  # A, C, E, SR
-    'bdfm': 'https://api-endpoint.mta.info/Dataservice/mtagtfsfeeds/nyct%2Fgtfs-bdfm',  # B, D, F, M, SF
-    'g': 'https://api-endpoint.mta.info/Dataservice/mtagtfsfeeds/nyct%2Fgtfs-g',  # G
-    'jz': 'https://api-endpoint.mta.info/Dataservice/mtagtfsfeeds/nyct%2Fgtfs-jz',  # J, Z
-    'nqrw': 'https://api-endpoint.mta.info/Dataservice/mtagtfsfeeds/nyct%2Fgtfs-nqrw',  # N, Q, R, W
-    'l': 'https://api-endpoint.mta.info/Dataservice/mtagtfsfeeds/nyct%2Fgtfs-l',  # L
-    '1234567': 'https://api-endpoint.mta.info/Dataservice/mtagtfsfeeds/nyct%2Fgtfs',  # 1, 2, 3, 4, 5, 6, 7, S
-    'si': 'https://api-endpoint.mta.info/Dataservice/mtagtfsfeeds/nyct%2Fgtfs-si'  # SIR
+import os
+
+# Point at a local replay server (scripts/tools/replay_feed_server.py) to run offline.
+MTA_FEED_BASE_URL = os.getenv('MTA_FEED_BASE_URL', 'https://api-endpoint.mta.info').rstrip('/')
+
+# MTA GTFS-realtime feed URL paths
+FEED_PATHS = {
+    'ace': '/Dataservice/mtagtfsfeeds/nyct%2Fgtfs-ace',  # A, C, E, SR
+    'bdfm': '/Dataservice/mtagtfsfeeds/nyct%2Fgtfs-bdfm',  # B, D, F, M, SF
+    'g': '/Dataservice/mtagtfsfeeds/nyct%2Fgtfs-g',  # G
+    'jz': '/Dataservice/mtagtfsfeeds/nyct%2Fgtfs-jz',  # J, Z
+    'nqrw': '/Dataservice/mtagtfsfeeds/nyct%2Fgtfs-nqrw',  # N, Q, R, W
+    'l': '/Dataservice/mtagtfsfeeds/nyct%2Fgtfs-l',  # L
+    '1234567': '/Dataservice/mtagtfsfeeds/nyct%2Fgtfs',  # 1, 2, 3, 4, 5, 6, 7, S
+    'si': '/Dataservice/mtagtfsfeeds/nyct%2Fgtfs-si'  # SIR
 }
 
+# MTA GTFS-realtime feed URLs
+FEEDS = {feed_key: MTA_FEED_BASE_URL + path for feed_key, path in FEED_PATHS.items()}
+
 # Map of routes to their feed keys
 ROUTE_TO_FEED = {
     'A': 'ace', 'C': 'ace', 'E': 'ace', 'SR': 'ace',
@@ -22,4 +30,28 @@ ROUTE_TO_FEED = {
     '4': '1234567', '5': '1234567', '6': '1234567', '7': '1234567',
     'S': '1234567',  # S train belongs to 1234567 feed
     'SIR': 'si'  # SIR is the Staten Island Railway
-} 
\ No newline at end of file
+} 
+# Per-feed refresh policy:
+#   interval: seconds a fetched feed stays fresh before it is downloaded again
+#   timeout:  seconds budgeted for the whole request, retries included
+#             (keep under app.FEED_FETCH_DEADLINE_SECONDS)
+#   priority: feeds at or below app.FEED_GRACE_MAX_PRIORITY get a grace period
+#             when a refresh overruns its deadline (lower matters more)
+# The large numbered-lines feed is polled a little less often; the small,
+# stable L/G/J-Z/SIR feeds can wait longer between downloads.
+DEFAULT_FEED_REFRESH_POLICY = {'interval': 15, 'timeout': 8, 'priority': 1}
+FEED_REFRESH_POLICIES = {
+    'ace': {'interval': 15, 'timeout': 8, 'priority': 1},
+    'bdfm': {'interval': 15, 'timeout': 8, 'priority': 1},
+    'g': {'interval': 30, 'timeout': 5, 'priority': 2},
+    'jz': {'interval': 30, 'timeout': 5, 'priority': 2},
+    'nqrw': {'interval': 15, 'timeout': 8, 'priority': 1},
+    'l': {'interval': 30, 'timeout': 5, 'priority': 2},
+    '1234567': {'interval': 20, 'timeout': 10, 'priority': 0},
+    'si': {'interval': 60, 'timeout': 5, 'priority': 3}
+}
+
+
+def get_feed_refresh_policy(feed_key):
+    """Return the refresh policy for a feed key, falling back to the default."""
+    return {**DEFAULT_FEED_REFRESH_POLICY, **FEED_REFRESH_POLICIES.get(feed_key, {})}
@@ -0,0 +1,90 @@
+"""One-time logging setup shared by the board, web controller and legacy app."""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+DEFAULT_LOG_LEVEL = "INFO"
+DEFAULT_LOG_FILENAME = "mta_debug.log"
+LOG_MAX_BYTES = 1_000_000
+LOG_BACKUP_COUNT = 3
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+# Chatty third-party loggers kept quiet unless overridden via LOG_LEVELS.
+DEFAULT_MODULE_LEVELS = {"urllib3": "WARNING"}
+
+_configured = False
+_configure_lock = threading.Lock()
+
+
+def resolve_log_path(log_path: str | Path | None = None) -> Path:
+    """Resolve log file path from argument, LOG_PATH env var, or repo default."""
+    if log_path is not None:
+        return Path(log_path).expanduser()
+
+    env_path = os.getenv("LOG_PATH")
+    if env_path:
+        return Path(env_path).expanduser()
+
+    return Path(__file__).resolve().parents[2] / "logs" / DEFAULT_LOG_FILENAME
+
+
+def parse_module_levels(raw_value: str | None) -> dict[str, int]:
+    """Parse ``"app=DEBUG,urllib3=WARNING"`` into logger levels."""
+    levels: dict[str, int] = {}
+    for item in (raw_value or "").split(","):
+        name, sep, level_name = item.partition("=")
+        if not sep or not name.strip():
+            continue
+        level = logging.getLevelName(level_name.strip().upper())
+        if isinstance(level, int):
+            levels[name.strip()] = level
+    return levels
+
+
+def configure_logging(log_path: str | Path | None = None):
+    """Install a rotating file handler once per process.
+
+    Root level comes from LOG_LEVEL; per-logger overrides from LOG_LEVELS.
+    Falls back to console logging if the log directory is not writable.
+    """
+    global _configured
+    with _configure_lock:
+        if _configured:
+            return
+
+        root_level = logging.getLevelName(
+            os.getenv("LOG_LEVEL", DEFAULT_LOG_LEVEL).strip().upper()
+        )
+        if not isinstance(root_level, int):
+            root_level = logging.INFO
+
+        formatter = logging.Formatter(LOG_FORMAT)
+        path = resolve_log_path(log_path)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            handler: logging.Handler = RotatingFileHandler(
+                path,
+                maxBytes=LOG_MAX_BYTES,
+                backupCount=LOG_BACKUP_COUNT,
+                encoding="utf-8",
+            )
+        except OSError:
+            handler = logging.StreamHandler()
+        handler.setFormatter(formatter)
+
+        root_logger = logging.getLogger()
+        root_logger.addHandler(handler)
+        root_logger.setLevel(root_level)
+
+        module_levels = parse_module_levels(
+            ",".join(f"{name}={level}" for name, level in DEFAULT_MODULE_LEVELS.items())
+        )
+        module_levels.update(parse_module_levels(os.getenv("LOG_LEVELS")))
+        for name, level in module_levels.items():
+            logging.getLogger(name).setLevel(level)
+
+        _configured = True
@@ -0,0 +1,71 @@
+"""Turn arrival epochs into whole minutes and per-consumer labels."""
+
+from __future__ import annotations
+
+from array import array
+from functools import lru_cache
+from itertools import chain
+from typing import Iterable, Sequence
+
+LED_LABEL_MAX_CHARS = 3
+
+
+def minutes_until(arrival_epochs: Sequence[int], current_time: int) -> array:
+    """Whole minutes until each arrival, rounded half up; under a minute is 0."""
+    return array(
+        "l",
+        [
+            0 if (delta := arrival_time - current_time) < 60 else (delta + 30) // 60
+            for arrival_time in arrival_epochs
+        ],
+    )
+
+
+def minutes_until_batch(
+    epoch_lists: Sequence[Sequence[int]],
+    current_time: int,
+) -> list[array]:
+    """Compute minutes for many arrival lists in one pass over a flat epoch array."""
+    flat_minutes = minutes_until(array("q", chain.from_iterable(epoch_lists)), current_time)
+    batches: list[array] = []
+    start = 0
+    for epochs in epoch_lists:
+        end = start + len(epochs)
+        batches.append(flat_minutes[start:end])
+        start = end
+    return batches
+
+
+def next_minutes_change(arrival_epochs: Iterable[int], current_time: int) -> int | None:
+    """Earliest second after ``current_time`` when a ``minutes_until`` value changes or an arrival passes."""
+    soonest: int | None = None
+    for arrival_time in arrival_epochs:
+        delta = arrival_time - current_time
+        if delta <= 0:
+            continue
+        if delta < 60:
+            change = arrival_time
+        elif delta < 90:
+            change = arrival_time - 59
+        else:
+            change = arrival_time - (60 * ((delta + 30) // 60) - 31)
+        if soonest is None or change < soonest:
+            soonest = change
+    return soonest
+
+
+@lru_cache(maxsize=512)
+def web_label(minutes: int) -> str:
+    """Label for the web views: ``Now`` or ``N min``."""
+    return "Now" if minutes < 1 else f"{minutes} min"
+
+
+@lru_cache(maxsize=512)
+def led_label(minutes: int, max_chars: int = LED_LABEL_MAX_CHARS) -> str:
+    """Label for one LED time box: ``NOW``, ``Nm``, or the bare number when ``Nm`` is too wide."""
+    if minutes < 1:
+        return "NOW"
+    label = f"{minutes}m"
+    if len(label) > max_chars:
+        label = str(minutes)[:max_chars]
+    return label
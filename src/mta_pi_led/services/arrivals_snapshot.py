@@ -0,0 +1,147 @@
+"""Shared, pre-serialized arrivals snapshots for the web controller API."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from mta_pi_led.services.background_refresher import BackgroundRefresher
+from mta_pi_led.services.board_config import DEFAULT_REFRESH_SECONDS
+
+StationPayloads = dict[str, dict[str, Any]]
+# How long a request for a new station list waits for the worker's first
+# snapshot: the feed fetch deadline plus its grace period, with headroom.
+FIRST_SNAPSHOT_TIMEOUT_SECONDS = 20.0
+
+
+@dataclass(frozen=True)
+class ArrivalsSnapshot:
+    """One refresh of arrivals for a station list, ready to send."""
+
+    stations: tuple[str, ...]
+    arrivals: StationPayloads
+    updated_at: str
+    etag: str
+    body: bytes
+    # Per-station content digests, so push clients can be sent only what changed.
+    station_digests: dict[str, str]
+
+
+def _digest(value: Any) -> str:
+    encoded = json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha1(encoded).hexdigest()
+
+
+def _stable_payload(payload: dict[str, Any]) -> dict[str, Any]:
+    return {key: value for key, value in payload.items() if key != "timestamp"}
+
+
+def arrivals_digest(arrivals: StationPayloads) -> str:
+    """Content hash of arrivals, ignoring the per-refresh ``timestamp`` field."""
+    return _digest(
+        {station_id: _stable_payload(payload) for station_id, payload in arrivals.items()}
+    )
+
+
+def diff_station_digests(
+    previous: dict[str, str],
+    snapshot: ArrivalsSnapshot,
+) -> StationPayloads:
+    """Return payloads of stations whose digest differs from ``previous``."""
+    return {
+        station_id: snapshot.arrivals[station_id]
+        for station_id, digest in snapshot.station_digests.items()
+        if previous.get(station_id) != digest
+    }
+
+
+class ArrivalsPublisher:
+    """Refresh arrivals for the configured stations on a background thread.
+
+    Every HTTP client reads the same snapshot, so polling costs no upstream
+    work. A refresh whose content is unchanged republishes the previous
+    snapshot, keeping its body and ETag stable.
+    """
+
+    def __init__(
+        self,
+        fetch_arrivals: Callable[[list[str]], StationPayloads],
+        now: Callable[[], str],
+    ):
+        self._fetch_arrivals = fetch_arrivals
+        self._now = now
+        self._lock = threading.Lock()
+        self._published = threading.Condition()
+        self._published_snapshot: ArrivalsSnapshot | None = None
+        self._job_key: tuple[str, ...] | None = None
+        self._refresh_seconds: float = DEFAULT_REFRESH_SECONDS
+        self._refresher: BackgroundRefresher[ArrivalsSnapshot] = BackgroundRefresher(
+            name="web-arrivals-refresher",
+            interval_seconds=lambda: self._refresh_seconds,
+        )
+
+    def current(self, stations: list[str], refresh_seconds: float) -> ArrivalsSnapshot | None:
+        """Return the latest snapshot for ``stations``, or None if none lands in time.
+
+        Only the first requests for a new list wait, on the worker's fetch.
+        """
+        job_key = tuple(stations)
+        with self._lock:
+            self._refresh_seconds = refresh_seconds
+            if self._job_key != job_key:
+                self._job_key = job_key
+                self._refresher.set_job(job_key, lambda: self._build(job_key))
+            self._refresher.start()
+
+        with self._published:
+            self._published.wait_for(
+                lambda: self._published_snapshot is not None
+                and self._published_snapshot.stations == job_key,
+                timeout=FIRST_SNAPSHOT_TIMEOUT_SECONDS,
+            )
+            snapshot = self._published_snapshot
+        if snapshot is None or snapshot.stations != job_key:
+            return None
+        return snapshot
+
+    def wait_for_update(self, etag: str | None, timeout: float) -> bool:
+        """Block until a snapshot other than ``etag`` is published or ``timeout`` passes."""
+        with self._published:
+            return self._published.wait_for(
+                lambda: self._published_snapshot is not None
+                and self._published_snapshot.etag != etag,
+                timeout=timeout,
+            )
+
+    def stop(self):
+        self._refresher.stop(timeout=1)
+
+    def _build(self, job_key: tuple[str, ...]) -> ArrivalsSnapshot:
+        arrivals = self._fetch_arrivals(list(job_key))
+        etag = arrivals_digest(arrivals)
+
+        previous = self._refresher.latest()
+        if previous is not None and previous.job_key is job_key and previous.value.etag == etag:
+            return previous.value
+
+        updated_at = self._now()
+        body = json.dumps({"arrivals": arrivals, "updated_at": updated_at}).encode("utf-8")
+        snapshot = ArrivalsSnapshot(
+            stations=job_key,
+            arrivals=arrivals,
+            updated_at=updated_at,
+            etag=etag,
+            body=body,
+            station_digests={
+                station_id: _digest(_stable_payload(payload))
+                for station_id, payload in arrivals.items()
+            },
+        )
+        if job_key is self._job_key:
+            with self._published:
+                self._published_snapshot = snapshot
+                self._published.notify_all()
+        return snapshot
@@ -0,0 +1,120 @@
+"""Background worker that refreshes data off the caller's thread."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RefreshSnapshot(Generic[T]):
+    """Immutable result of one background refresh."""
+
+    generation: int
+    refreshed_at: float
+    job_key: Any
+    value: T
+
+
+class BackgroundRefresher(Generic[T]):
+    """Run a fetch job on a daemon thread and publish snapshots atomically.
+
+    Readers call ``latest()`` and never block on network I/O, or sleep in
+    ``wait_for_newer`` until a snapshot lands. ``set_job`` swaps what is
+    fetched (e.g. after a config reload) and wakes the worker.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        interval_seconds: Callable[[], float],
+        clock: Callable[[], float] = time.time,
+    ):
+        self._name = name
+        self._interval_seconds = interval_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._published = threading.Condition(self._lock)
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._job_key: Any = None
+        self._fetch: Callable[[], T] | None = None
+        self._latest: RefreshSnapshot[T] | None = None
+        self._generation = 0
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def set_job(self, job_key: Any, fetch: Callable[[], T]):
+        """Replace the fetch job and refresh immediately."""
+        with self._lock:
+            self._job_key = job_key
+            self._fetch = fetch
+        self._wake.set()
+
+    def latest(self) -> RefreshSnapshot[T] | None:
+        with self._lock:
+            return self._latest
+
+    def wait_for_newer(self, generation: int, timeout: float) -> bool:
+        """Block until a snapshot newer than ``generation`` is published or ``timeout`` passes."""
+        with self._published:
+            return self._published.wait_for(lambda: self._generation > generation, timeout=timeout)
+
+    def refresh_once(self) -> RefreshSnapshot[T] | None:
+        """Run the current job on the calling thread and publish the result."""
+        self._wake.clear()
+        with self._lock:
+            job_key = self._job_key
+            fetch = self._fetch
+        if fetch is None:
+            return None
+
+        value = fetch()
+        with self._lock:
+            # Drop results for a job that was replaced while fetching.
+            if job_key is not self._job_key:
+                return self._latest
+            self._generation += 1
+            self._latest = RefreshSnapshot(
+                generation=self._generation,
+                refreshed_at=self._clock(),
+                job_key=job_key,
+                value=value,
+            )
+            self._published.notify_all()
+            return self._latest
+
+    def _run(self):
+        # A synchronous refresh_once() before start() counts as the first run.
+        if self.latest() is None:
+            self._refresh_logged()
+        while not self._stop.is_set():
+            self._wake.wait(max(0.1, self._interval_seconds()))
+            if self._stop.is_set():
+                break
+            self._refresh_logged()
+
+    def _refresh_logged(self):
+        try:
+            self.refresh_once()
+        except Exception:
+            logger.exception("Background refresh %s failed", self._name)
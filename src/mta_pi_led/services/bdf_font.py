@@ -0,0 +1,103 @@
+"""Rasterize BDF fonts into Pillow images the way rgbmatrix ``graphics.DrawText`` does."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from PIL import Image
+
+REPLACEMENT_CODEPOINT = 0xFFFD
+RGB = tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class BdfGlyph:
+    """One glyph as an ``L`` mask, placed relative to the text baseline."""
+
+    device_width: int
+    y_offset: int
+    mask: Image.Image
+
+
+def _glyph_mask(
+    rows: list[int],
+    bitmap_width: int,
+    x_offset: int,
+    device_width: int,
+) -> Image.Image:
+    row_bits = 8 * ((bitmap_width + 7) // 8)
+    mask = Image.new("L", (max(1, device_width), max(1, len(rows))), 0)
+    pixels = mask.load()
+    for y, value in enumerate(rows):
+        for column in range(bitmap_width):
+            x = column + x_offset
+            # rgbmatrix draws only the advance width, never left of the pen.
+            if 0 <= x < device_width and value >> (row_bits - 1 - column) & 1:
+                pixels[x, y] = 255
+    return mask
+
+
+class BdfFont:
+    """Glyphs parsed from a BDF file, drawn at a baseline like ``graphics.DrawText``."""
+
+    def __init__(self, glyphs: dict[int, BdfGlyph]):
+        self._glyphs = glyphs
+
+    @classmethod
+    def load(cls, path: str | Path) -> BdfFont:
+        glyphs: dict[int, BdfGlyph] = {}
+        codepoint = -1
+        device_width = 0
+        bbx = (0, 0, 0, 0)
+        rows: list[int] | None = None
+
+        with open(path, encoding="latin-1") as font_file:
+            for line in font_file:
+                keyword, _, value = line.strip().partition(" ")
+                if rows is not None:
+                    if keyword == "ENDCHAR":
+                        width, height, x_offset, y_offset = bbx
+                        if codepoint >= 0 and len(rows) == height:
+                            glyphs[codepoint] = BdfGlyph(
+                                device_width=device_width,
+                                y_offset=y_offset,
+                                mask=_glyph_mask(rows, width, x_offset, device_width),
+                            )
+                        rows = None
+                    elif keyword:
+                        rows.append(int(keyword, 16))
+                elif keyword == "ENCODING":
+                    codepoint = int(value.split()[0])
+                elif keyword == "DWIDTH":
+                    device_width = int(value.split()[0])
+                elif keyword == "BBX":
+                    width, height, x_offset, y_offset = (int(part) for part in value.split())
+                    bbx = (width, height, x_offset, y_offset)
+                elif keyword == "BITMAP":
+                    rows = []
+        return cls(glyphs)
+
+    def _glyph(self, character: str) -> BdfGlyph | None:
+        glyph = self._glyphs.get(ord(character))
+        return glyph if glyph is not None else self._glyphs.get(REPLACEMENT_CODEPOINT)
+
+    def text_width(self, text: str) -> int:
+        return sum(glyph.device_width for glyph in map(self._glyph, text) if glyph)
+
+    def draw_text(
+        self,
+        image: Image.Image,
+        position: tuple[int, int],
+        color: RGB,
+        text: str,
+    ) -> int:
+        """Draw ``text`` with its baseline at ``position``; return the advance width."""
+        x, baseline = position
+        for glyph in map(self._glyph, text):
+            if glyph is None:
+                continue
+            top = baseline - glyph.mask.height - glyph.y_offset
+            image.paste(color, (x, top), glyph.mask)
+            x += glyph.device_width
+        return x - position[0]
@@ -12,6 +12,8 @@ from typing import Any
 DEFAULT_STATIONS = ["B10"]
 DEFAULT_ROTATION_SECONDS = 10
 DEFAULT_REFRESH_SECONDS = 30
+DEFAULT_MIN_REFRESH_SECONDS = 10
+DEFAULT_MAX_REFRESH_SECONDS = 120
 DEFAULT_CITIBIKE_STATION_ID = "66dbc551-0aca-11e7-82f6-3863bb44ef7c"
 CONFIG_READ_RETRY_ATTEMPTS = 4
 CONFIG_READ_RETRY_DELAY_SECONDS = 0.12
@@ -25,6 +27,8 @@ class BoardConfig:
     rotation_seconds: int
     refresh_seconds: int
     citibike_station_id: str
+    min_refresh_seconds: int = DEFAULT_MIN_REFRESH_SECONDS
+    max_refresh_seconds: int = DEFAULT_MAX_REFRESH_SECONDS
 
     @property
     def primary_station(self) -> str:
@@ -35,18 +39,28 @@ def load_board_config(config_path: str | Path | None = None) -> BoardConfig:
     """Load board config from JSON with validation and safe defaults."""
     path = resolve_board_config_path(config_path)
     payload = _load_payload_with_retry(path)
+    refresh_seconds = _as_positive_int(
+        payload.get("refresh_seconds"), DEFAULT_REFRESH_SECONDS
+    )
 
     return BoardConfig(
         stations=_as_station_list(payload.get("stations")),
         rotation_seconds=_as_positive_int(
             payload.get("rotation_seconds"), DEFAULT_ROTATION_SECONDS
         ),
-        refresh_seconds=_as_positive_int(
-            payload.get("refresh_seconds"), DEFAULT_REFRESH_SECONDS
-        ),
+        refresh_seconds=refresh_seconds,
         citibike_station_id=_as_non_empty_str(
             payload.get("citibike_station_id"), DEFAULT_CITIBIKE_STATION_ID
         ),
+        # Bounds always bracket refresh_seconds.
+        min_refresh_seconds=min(
+            refresh_seconds,
+            _as_positive_int(payload.get("min_refresh_seconds"), DEFAULT_MIN_REFRESH_SECONDS),
+        ),
+        max_refresh_seconds=max(
+            refresh_seconds,
+            _as_positive_int(payload.get("max_refresh_seconds"), DEFAULT_MAX_REFRESH_SECONDS),
+        ),
     )
 
 
@@ -10,6 +10,8 @@ from typing import Any
 
 from mta_pi_led.services.board_config import (
     DEFAULT_CITIBIKE_STATION_ID,
+    DEFAULT_MAX_REFRESH_SECONDS,
+    DEFAULT_MIN_REFRESH_SECONDS,
     DEFAULT_REFRESH_SECONDS,
     DEFAULT_ROTATION_SECONDS,
     DEFAULT_STATIONS,
@@ -150,6 +152,30 @@ def normalize_config_payload(
     if refresh_error:
         (errors if strict else warnings).append(refresh_error)
 
+    min_refresh_seconds, min_refresh_error = _parse_positive_int(
+        source.get("min_refresh_seconds"),
+        DEFAULT_MIN_REFRESH_SECONDS,
+        field_name="min_refresh_seconds",
+    )
+    if min_refresh_error:
+        (errors if strict else warnings).append(min_refresh_error)
+
+    max_refresh_seconds, max_refresh_error = _parse_positive_int(
+        source.get("max_refresh_seconds"),
+        DEFAULT_MAX_REFRESH_SECONDS,
+        field_name="max_refresh_seconds",
+    )
+    if max_refresh_error:
+        (errors if strict else warnings).append(max_refresh_error)
+
+    # Widen the adaptive bounds rather than reject a refresh_seconds edit.
+    if min_refresh_seconds > refresh_seconds or max_refresh_seconds < refresh_seconds:
+        warnings.append(
+            "min_refresh_seconds/max_refresh_seconds widened to include refresh_seconds."
+        )
+        min_refresh_seconds = min(min_refresh_seconds, refresh_seconds)
+        max_refresh_seconds = max(max_refresh_seconds, refresh_seconds)
+
     citibike_station_id = _as_non_empty_str(
         source.get("citibike_station_id"), DEFAULT_CITIBIKE_STATION_ID
     )
@@ -171,6 +197,8 @@ def normalize_config_payload(
         "stations": stations,
         "rotation_seconds": rotation_seconds,
         "refresh_seconds": refresh_seconds,
+        "min_refresh_seconds": min_refresh_seconds,
+        "max_refresh_seconds": max_refresh_seconds,
         "citibike_station_id": citibike_station_id,
     }
     return normalized, errors, warnings
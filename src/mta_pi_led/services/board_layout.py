@@ -0,0 +1,114 @@
+"""LED board geometry, colors, icons and text tiles, importable without the matrix driver."""
+
+from __future__ import annotations
+
+from PIL import Image
+
+from mta_pi_led.services.bdf_font import BdfFont
+from mta_pi_led.services.raster import RGB, Bitmap, Box
+
+PANEL_SIZE = (64, 32)  # cols, rows
+
+
+class Layout:
+    """Display layout positions and sizes"""
+    ICON_SIZE = (18, 18)
+    ICON_POSITION = (1, 8)
+
+    STATION_NAME_POSITION = (1, 6)
+
+    # Uptown direction
+    UPTOWN_LABEL_POSITION = (22, 6)
+    UPTOWN_TIME_1_POSITION = (22, 12)
+    UPTOWN_TIME_2_POSITION = (36, 12)
+    UPTOWN_TIME_3_POSITION = (50, 12)
+
+    # Downtown direction
+    DOWNTOWN_LABEL_POSITION = (22, 19)
+    DOWNTOWN_TIME_1_POSITION = (22, 25)
+    DOWNTOWN_TIME_2_POSITION = (36, 25)
+    DOWNTOWN_TIME_3_POSITION = (50, 25)
+
+    # Time box dimensions
+    TIME_BOX_WIDTH = 12   # 3 chars × 4px per char = 12px
+    TIME_BOX_HEIGHT = 6   # Font height
+
+    # Bike icon position
+    BIKE_ICON_POSITION = (1, 26)
+    EBIKE_ICON_POSITION = (21, 26)
+
+    CHAR_WIDTH = 4
+    CHAR_HEIGHT = 6
+
+
+class Colors:
+    """RGB color definitions"""
+    WHITE = (255, 255, 255)
+    GREEN = (0, 255, 0)
+    YELLOW = (255, 255, 0)
+    RED = (255, 0, 0)
+    DAZZLING_BLUE = (57, 80, 160)
+    BLUE = (0, 0, 255)
+
+
+# Icons are precomputed masks, blitted with one SetImage each.
+BIKE_ICON = Bitmap((
+    (0, 1, 1, 1, 0, 0, 0, 0, 0, 0),
+    (0, 0, 1, 0, 1, 1, 0, 0, 0, 0),
+    (0, 1, 1, 0, 0, 1, 0, 1, 1, 0),
+    (1, 0, 0, 1, 1, 1, 1, 0, 0, 1),
+    (1, 0, 0, 1, 0, 0, 1, 0, 0, 1),
+    (0, 1, 1, 0, 0, 0, 0, 1, 1, 0),
+))
+EBIKE_ICON = Bitmap((  # plug indicator
+    (0, 0, 1, 0),
+    (0, 1, 0, 0),
+    (1, 1, 1, 1),
+    (0, 0, 1, 0),
+    (0, 1, 0, 0),
+    (1, 0, 0, 0),
+))
+
+
+def text_box(position: tuple[int, int], width: int) -> Box:
+    """Region covered by one line of text drawn at a baseline position."""
+    return (
+        position[0],
+        position[1] - Layout.CHAR_HEIGHT + 1,
+        width,
+        Layout.CHAR_HEIGHT,
+    )
+
+
+def render_text_tile(
+    font: BdfFont | None,
+    box: Box,
+    position: tuple[int, int],
+    color: RGB,
+    text: str,
+) -> Image.Image:
+    """One line of text on black, sized to ``box`` with its baseline at ``position``."""
+    tile = Image.new("RGB", box[2:])
+    if font:
+        font.draw_text(tile, (position[0] - box[0], position[1] - box[1]), color, text)
+    return tile
+
+
+def render_name_strip(
+    font: BdfFont | None,
+    name: str,
+    visible_width: int,
+    gap_width: int,
+) -> tuple[Image.Image, int]:
+    """Rasterize ``name`` into a strip to crop scroll windows from; return it and its period.
+
+    The period is 0 when the name fits. Otherwise the name repeats one period
+    later, so every window is a plain crop.
+    """
+    text_width = font.text_width(name) if font else 0
+    period = text_width + gap_width if text_width > visible_width else 0
+    strip = Image.new("RGB", (period + visible_width, Layout.CHAR_HEIGHT))
+    if font:
+        for x in {0, period}:
+            font.draw_text(strip, (x, Layout.CHAR_HEIGHT - 1), Colors.WHITE, name)
+    return strip, period
@@ -4,9 +4,10 @@ Simple Citi Bike availability checker.
 Gets bike, e-bike, and dock availability for a given station.
 """
 
-import requests
 from typing import Dict, Optional, Tuple
 
+from mta_pi_led.services.http_client import http_get
+
 INFO_URL = 'https://gbfs.citibikenyc.com/gbfs/en/station_information.json'
 STATUS_URL = 'https://gbfs.citibikenyc.com/gbfs/en/station_status.json' 
 
@@ -14,7 +15,7 @@ def get_station_info(station_name: str) -> Dict:
     """
     Get the ID of a Citi Bike station by its name.
     """
-    info_response = requests.get(INFO_URL, timeout=10)
+    info_response = http_get(INFO_URL, timeout=10)
     stations_info = info_response.json()['data']['stations']
     for station in stations_info:
         if station['name'] == station_name:
@@ -33,7 +34,7 @@ def get_station_data(id: str) -> Optional[Dict]:
     Returns:
         Dict with 'bikes', 'ebikes', 'docks' or None if not found
     """
-    status_response = requests.get(STATUS_URL, timeout=10)
+    status_response = http_get(STATUS_URL, timeout=10)
     
     if status_response.status_code != 200:
         return None
@@ -0,0 +1,279 @@
+"""Process-wide TTL cache for GTFS-realtime feeds."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Mapping, Optional
+
+DEFAULT_FEED_CACHE_TTL_SECONDS = 15.0
+DEFAULT_BACKOFF_BASE_SECONDS = 5.0
+DEFAULT_BACKOFF_MAX_SECONDS = 300.0
+
+
+class FeedCircuitOpenError(RuntimeError):
+    """Raised instead of fetching while a feed's circuit breaker is open."""
+
+
+class FeedWaitTimeoutError(RuntimeError):
+    """Raised when another caller's in-flight fetch outlasts the wait limit."""
+
+
+class _LazyParse:
+    """Parse raw feed bytes on first access and memoize the result."""
+
+    def __init__(self, parser: Callable[[bytes], Any]):
+        self._parser = parser
+        self._lock = threading.Lock()
+        self._value: Any = None
+        self._parsed = False
+
+    @property
+    def is_parsed(self) -> bool:
+        return self._parsed
+
+    def get(self, content: bytes) -> Any:
+        if self._parsed:
+            return self._value
+        with self._lock:
+            if not self._parsed:
+                self._value = self._parser(content)
+                self._parsed = True
+        return self._value
+
+
+@dataclass(frozen=True)
+class FeedSnapshot:
+    """Raw feed bytes plus the monotonic time they were fetched.
+
+    ``feed`` parses the full message lazily, so callers that only need a
+    selective decode of ``content`` never pay for a full parse.
+    """
+
+    feed_key: str
+    content: bytes
+    fetched_at: float
+    header_timestamp: int = 0
+    etag: str | None = None
+    last_modified: str | None = None
+    _lazy_feed: _LazyParse | None = field(default=None, compare=False, repr=False)
+
+    @property
+    def feed(self) -> Any:
+        if self._lazy_feed is None:
+            raise RuntimeError(f"No parser configured for feed {self.feed_key}")
+        return self._lazy_feed.get(self.content)
+
+    @property
+    def is_parsed(self) -> bool:
+        return self._lazy_feed is not None and self._lazy_feed.is_parsed
+
+
+@dataclass(frozen=True)
+class FeedFetchResult:
+    """Fresh feed content returned by a fetcher."""
+
+    content: bytes
+    header_timestamp: int = 0
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+# A fetcher receives the previous snapshot (for conditional requests) and
+# returns None when upstream reports the feed as unchanged.
+FeedFetcher = Callable[[str, Optional[FeedSnapshot]], Optional[FeedFetchResult]]
+
+
+@dataclass
+class _FeedHealth:
+    """Consecutive failures for one feed and when the next attempt is allowed."""
+
+    failures: int = 0
+    retry_at: float = 0.0
+
+
+@dataclass
+class _InFlightFetch:
+    """Fetch shared by every caller that missed the cache for one feed key."""
+
+    done: threading.Event = field(default_factory=threading.Event)
+    snapshot: FeedSnapshot | None = None
+    error: BaseException | None = None
+
+
+class FeedCache:
+    """Cache parsed feeds per feed key with single-flight fetching.
+
+    Cached feed objects are shared between callers and must be treated as
+    read-only. An unchanged upstream feed keeps the same ``feed`` object and
+    ``header_timestamp`` so callers can reuse work derived from it.
+    ``ttl_by_key`` gives individual feeds their own freshness window.
+
+    Each feed has a circuit breaker: after a failed fetch, further fetches
+    for that key are refused for an exponentially growing backoff, while the
+    last good snapshot stays available through ``get_last_good``.
+
+    Callers that join another caller's in-flight fetch wait at most
+    ``wait_timeout_seconds`` for it (``None`` waits indefinitely).
+    """
+
+    def __init__(
+        self,
+        fetcher: FeedFetcher,
+        parser: Callable[[bytes], Any],
+        ttl_seconds: float = DEFAULT_FEED_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        ttl_by_key: Mapping[str, float] | None = None,
+        backoff_base_seconds: float = DEFAULT_BACKOFF_BASE_SECONDS,
+        backoff_max_seconds: float = DEFAULT_BACKOFF_MAX_SECONDS,
+        wait_timeout_seconds: float | None = None,
+    ):
+        self._fetcher = fetcher
+        self._parser = parser
+        self._clock = clock
+        self.ttl_seconds = ttl_seconds
+        self.ttl_by_key = dict(ttl_by_key or {})
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.wait_timeout_seconds = wait_timeout_seconds
+        self._lock = threading.Lock()
+        self._entries: dict[str, FeedSnapshot] = {}
+        self._in_flight: dict[str, _InFlightFetch] = {}
+        self._health: dict[str, _FeedHealth] = {}
+
+    def ttl_for(self, feed_key: str) -> float:
+        return self.ttl_by_key.get(feed_key, self.ttl_seconds)
+
+    def get_fresh(self, feed_key: str) -> FeedSnapshot | None:
+        """Return the cached snapshot if it is still within the TTL."""
+        with self._lock:
+            return self._fresh_entry(feed_key)
+
+    def get_last_good(self, feed_key: str, max_age_seconds: float) -> FeedSnapshot | None:
+        """Return the last successfully fetched snapshot if it is at most ``max_age_seconds`` old."""
+        with self._lock:
+            snapshot = self._entries.get(feed_key)
+        if snapshot is None or self.age_seconds(snapshot) > max_age_seconds:
+            return None
+        return snapshot
+
+    def age_seconds(self, snapshot: FeedSnapshot) -> float:
+        """Seconds since ``snapshot`` was fetched or last revalidated."""
+        return max(0.0, self._clock() - snapshot.fetched_at)
+
+    def is_circuit_open(self, feed_key: str) -> bool:
+        with self._lock:
+            health = self._health.get(feed_key)
+            return health is not None and self._clock() < health.retry_at
+
+    def get(self, feed_key: str) -> FeedSnapshot:
+        """Return a fresh snapshot, fetching at most once across concurrent callers.
+
+        Raises FeedCircuitOpenError without fetching while the feed is backing off.
+        """
+        with self._lock:
+            snapshot = self._fresh_entry(feed_key)
+            if snapshot is not None:
+                return snapshot
+
+            health = self._health.get(feed_key)
+            if health is not None and self._clock() < health.retry_at:
+                raise FeedCircuitOpenError(
+                    f"Feed {feed_key} backing off for "
+                    f"{health.retry_at - self._clock():.0f}s after {health.failures} failure(s)"
+                )
+
+            previous = self._entries.get(feed_key)
+            in_flight = self._in_flight.get(feed_key)
+            is_leader = in_flight is None
+            if in_flight is None:
+                in_flight = _InFlightFetch()
+                self._in_flight[feed_key] = in_flight
+
+        if not is_leader:
+            if not in_flight.done.wait(self.wait_timeout_seconds):
+                raise FeedWaitTimeoutError(
+                    f"Feed {feed_key} fetch still in flight after {self.wait_timeout_seconds}s"
+                )
+            if in_flight.error is not None:
+                raise in_flight.error
+            assert in_flight.snapshot is not None
+            return in_flight.snapshot
+
+        try:
+            result = self._fetcher(feed_key, previous)
+            if result is None and previous is not None:
+                snapshot = replace(previous, fetched_at=self._clock())
+            elif result is None:
+                raise RuntimeError(f"Fetcher reported {feed_key} unchanged with no cached copy")
+            else:
+                snapshot = FeedSnapshot(
+                    feed_key=feed_key,
+                    content=result.content,
+                    fetched_at=self._clock(),
+                    header_timestamp=result.header_timestamp,
+                    etag=result.etag,
+                    last_modified=result.last_modified,
+                    _lazy_feed=_LazyParse(self._parser),
+                )
+            in_flight.snapshot = snapshot
+            with self._lock:
+                self._entries[feed_key] = snapshot
+                self._health.pop(feed_key, None)
+            return snapshot
+        except BaseException as exc:
+            in_flight.error = exc
+            if isinstance(exc, Exception):
+                self._record_failure(feed_key)
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(feed_key, None)
+            in_flight.done.set()
+
+    def invalidate(self, feed_key: str | None = None):
+        """Drop one cached feed, or every cached feed when no key is given."""
+        with self._lock:
+            if feed_key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(feed_key, None)
+
+    def _record_failure(self, feed_key: str):
+        with self._lock:
+            health = self._health.setdefault(feed_key, _FeedHealth())
+            health.failures += 1
+            backoff = min(
+                self.backoff_max_seconds,
+                self.backoff_base_seconds * (2 ** min(health.failures - 1, 16)),
+            )
+            health.retry_at = self._clock() + backoff
+
+    def _fresh_entry(self, feed_key: str) -> FeedSnapshot | None:
+        snapshot = self._entries.get(feed_key)
+        if snapshot is None:
+            return None
+        if (self._clock() - snapshot.fetched_at) >= self.ttl_for(feed_key):
+            return None
+        return snapshot
+
+
+def resolve_feed_cache_ttl_seconds() -> float:
+    """Resolve feed cache TTL from FEED_CACHE_TTL_SECONDS or the default."""
+    raw_value = os.getenv("FEED_CACHE_TTL_SECONDS")
+    if raw_value is None:
+        return DEFAULT_FEED_CACHE_TTL_SECONDS
+    try:
+        parsed = float(raw_value)
+    except ValueError:
+        return DEFAULT_FEED_CACHE_TTL_SECONDS
+    return parsed if parsed >= 0 else DEFAULT_FEED_CACHE_TTL_SECONDS
+
+
+def resolve_feed_ttls(intervals: Mapping[str, float]) -> dict[str, float]:
+    """Per-feed TTLs from refresh policies; a set FEED_CACHE_TTL_SECONDS applies to every feed instead."""
+    if os.getenv("FEED_CACHE_TTL_SECONDS") is not None:
+        return {}
+    return dict(intervals)
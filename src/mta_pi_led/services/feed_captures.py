@@ -0,0 +1,154 @@
+"""Captured GTFS-realtime feeds for offline replay, load tests and benchmarks."""
+
+from __future__ import annotations
+
+import re
+import struct
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+from google.protobuf import json_format
+from google.transit import gtfs_realtime_pb2
+
+# raw_feed_<feed_key>_<YYYYMMDD>_<HHMMSS>.(json|pb)
+CAPTURE_NAME_PATTERN = re.compile(r"^raw_feed_(?P<feed_key>.+)_(?P<stamp>\d{8}_\d{6})\.(?P<ext>json|pb)$")
+
+
+def default_captures_dir() -> Path:
+    return Path(__file__).resolve().parents[3] / "examples"
+
+
+def read_capture(path: str | Path) -> bytes:
+    """Return serialized FeedMessage bytes for a .pb or pretty-printed .json capture."""
+    path = Path(path)
+    if path.suffix == ".pb":
+        return path.read_bytes()
+
+    message = json_format.Parse(
+        path.read_text(encoding="utf-8"),
+        gtfs_realtime_pb2.FeedMessage(),
+        ignore_unknown_fields=True,
+    )
+    return message.SerializeToString()
+
+
+def find_latest_captures(captures_dir: str | Path | None = None) -> dict[str, Path]:
+    """Map feed key to its newest capture file (binary wins over JSON on ties)."""
+    directory = Path(captures_dir) if captures_dir is not None else default_captures_dir()
+    latest: dict[str, tuple[str, int, Path]] = {}
+    for path in sorted(directory.glob("raw_feed_*")):
+        match = CAPTURE_NAME_PATTERN.match(path.name)
+        if match is None:
+            continue
+        rank = (match.group("stamp"), 1 if match.group("ext") == "pb" else 0)
+        current = latest.get(match.group("feed_key"))
+        if current is None or rank > current[:2]:
+            latest[match.group("feed_key")] = (*rank, path)
+    return {feed_key: entry[2] for feed_key, entry in latest.items()}
+
+
+def load_latest_captures(captures_dir: str | Path | None = None) -> dict[str, bytes]:
+    """Load the newest capture per feed key as serialized FeedMessage bytes."""
+    return {
+        feed_key: read_capture(path)
+        for feed_key, path in find_latest_captures(captures_dir).items()
+    }
+
+
+# Append-only archive: file magic, then records of
+#   >H key length | key | >d captured_at (unix seconds) | >I payload length | zlib(payload)
+ARCHIVE_MAGIC = b"MTAFEED1"
+_RECORD_HEADER = struct.Struct(">H")
+_RECORD_META = struct.Struct(">dI")
+
+
+@dataclass(frozen=True)
+class ArchivedFeed:
+    """One raw FeedMessage snapshot read back from an archive."""
+
+    feed_key: str
+    captured_at: float
+    content: bytes
+
+
+class FeedArchiveWriter:
+    """Append raw feed snapshots to a compact archive file."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        is_new = not self.path.exists() or self.path.stat().st_size == 0
+        self._fh: BinaryIO = self.path.open("ab")
+        if is_new:
+            self._fh.write(ARCHIVE_MAGIC)
+            self._fh.flush()
+
+    def append(self, feed_key: str, captured_at: float, content: bytes):
+        key_bytes = feed_key.encode("utf-8")
+        payload = zlib.compress(content, 6)
+        self._fh.write(_RECORD_HEADER.pack(len(key_bytes)))
+        self._fh.write(key_bytes)
+        self._fh.write(_RECORD_META.pack(captured_at, len(payload)))
+        self._fh.write(payload)
+        self._fh.flush()
+
+    def close(self):
+        self._fh.close()
+
+    def __enter__(self) -> "FeedArchiveWriter":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def iter_archive(path: str | Path) -> Iterator[ArchivedFeed]:
+    """Yield archived snapshots in append order; stop quietly at a torn tail."""
+    with Path(path).open("rb") as fh:
+        if fh.read(len(ARCHIVE_MAGIC)) != ARCHIVE_MAGIC:
+            raise ValueError(f"Not a feed archive: {path}")
+        while True:
+            header = fh.read(_RECORD_HEADER.size)
+            if len(header) < _RECORD_HEADER.size:
+                return
+            (key_length,) = _RECORD_HEADER.unpack(header)
+            key_bytes = fh.read(key_length)
+            meta = fh.read(_RECORD_META.size)
+            if len(key_bytes) < key_length or len(meta) < _RECORD_META.size:
+                return
+            captured_at, payload_length = _RECORD_META.unpack(meta)
+            payload = fh.read(payload_length)
+            if len(payload) < payload_length:
+                return
+            yield ArchivedFeed(
+                feed_key=key_bytes.decode("utf-8"),
+                captured_at=captured_at,
+                content=zlib.decompress(payload),
+            )
+
+
+def shift_feed_times(content: bytes, offset_seconds: int) -> bytes:
+    """Return the feed with every timestamp moved by ``offset_seconds``.
+
+    Used by replay so old captures look current to code comparing arrivals
+    against the wall clock.
+    """
+    feed = gtfs_realtime_pb2.FeedMessage()
+    feed.ParseFromString(content)
+    if feed.header.HasField("timestamp"):
+        feed.header.timestamp += offset_seconds
+    for entity in feed.entity:
+        if entity.HasField("trip_update"):
+            trip_update = entity.trip_update
+            if trip_update.HasField("timestamp"):
+                trip_update.timestamp += offset_seconds
+            for stop_time_update in trip_update.stop_time_update:
+                if stop_time_update.HasField("arrival") and stop_time_update.arrival.HasField("time"):
+                    stop_time_update.arrival.time += offset_seconds
+                if stop_time_update.HasField("departure") and stop_time_update.departure.HasField("time"):
+                    stop_time_update.departure.time += offset_seconds
+        if entity.HasField("vehicle") and entity.vehicle.HasField("timestamp"):
+            entity.vehicle.timestamp += offset_seconds
+    return feed.SerializeToString()
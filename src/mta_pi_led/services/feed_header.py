@@ -0,0 +1,30 @@
+"""Read a GTFS-realtime feed's header timestamp without parsing the whole feed."""
+
+from __future__ import annotations
+
+from google.transit import gtfs_realtime_pb2
+
+
+def _decode_varint(data: bytes, offset: int) -> tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, offset
+        shift += 7
+
+
+def read_feed_header_timestamp(content: bytes) -> int | None:
+    """Decode only the leading FeedHeader (field 1) instead of the whole feed."""
+    if not content or content[0] != 0x0A:
+        return None
+    try:
+        length, offset = _decode_varint(content, 1)
+        header = gtfs_realtime_pb2.FeedHeader()
+        header.ParseFromString(content[offset:offset + length])
+    except Exception:
+        return None
+    return header.timestamp if header.HasField("timestamp") else None
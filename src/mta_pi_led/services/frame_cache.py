@@ -0,0 +1,35 @@
+"""LRU cache of composited LED frames keyed by what they show."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+from PIL import Image
+
+
+class FrameCache:
+    """Keep the most recently shown frames so repeat views skip compositing."""
+
+    def __init__(self, max_frames: int):
+        self.max_frames = max(1, max_frames)
+        self._frames: OrderedDict[Hashable, Image.Image] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_render(self, key: Hashable, render: Callable[[], Image.Image]) -> Image.Image:
+        frame = self._frames.get(key)
+        if frame is not None:
+            self._frames.move_to_end(key)
+            self.hits += 1
+            return frame
+
+        self.misses += 1
+        frame = render()
+        self._frames[key] = frame
+        if len(self._frames) > self.max_frames:
+            self._frames.popitem(last=False)
+        return frame
+
+    def __len__(self) -> int:
+        return len(self._frames)
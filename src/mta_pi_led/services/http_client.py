@@ -0,0 +1,85 @@
+"""Shared connection-pooled HTTP client for upstream MTA and GBFS calls."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_TIMEOUT_SECONDS = 10
+POOL_CONNECTIONS = 4
+# Keep-alive sockets per host. Every MTA feed is on one host and a refresh
+# fetches them all at once (app.FEED_FETCH_MAX_WORKERS = len(FEEDS) = 8).
+POOL_MAXSIZE = 8
+RETRY_TOTAL = 2
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUS_FORCELIST = (429, 500, 502, 503, 504)
+# Floor for one attempt's timeout when a small budget is split across retries.
+MIN_ATTEMPT_TIMEOUT_SECONDS = 1.0
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def retry_backoff_seconds() -> float:
+    """Total sleep urllib3 adds between attempts (the first retry is immediate)."""
+    return sum(RETRY_BACKOFF_FACTOR * 2 ** (attempt - 1) for attempt in range(2, RETRY_TOTAL + 1))
+
+
+def attempt_timeout(budget_seconds: float) -> float:
+    """Per-attempt timeout that keeps every retry and its backoff inside ``budget_seconds``."""
+    return max(
+        MIN_ATTEMPT_TIMEOUT_SECONDS,
+        (budget_seconds - retry_backoff_seconds()) / (RETRY_TOTAL + 1),
+    )
+
+
+def build_session() -> requests.Session:
+    """Create a session with bounded keep-alive pools and retry/backoff.
+
+    ``Retry-After`` is ignored: a 429/503 asking for minutes would otherwise
+    stall the caller far past its budget. Failing fast lets the feed cache's
+    circuit breaker back off instead.
+    """
+    retry = Retry(
+        total=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_FORCELIST,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=False,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=retry,
+        pool_block=False,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide pooled session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = build_session()
+    return _session
+
+
+def http_get(url: str, **kwargs: Any) -> requests.Response:
+    """GET through the shared session.
+
+    ``timeout`` (default ``DEFAULT_TIMEOUT_SECONDS``) budgets the whole call,
+    retries and backoff included, and is split evenly across the attempts.
+    """
+    kwargs["timeout"] = attempt_timeout(kwargs.get("timeout", DEFAULT_TIMEOUT_SECONDS))
+    return get_session().get(url, **kwargs)
+
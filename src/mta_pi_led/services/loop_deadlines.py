@@ -0,0 +1,34 @@
+"""Pick when the board render loop next has work, so it can sleep until then."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Mapping
+
+
+@dataclass(frozen=True)
+class Deadline:
+    """When the loop next has work, and which event it is."""
+
+    at: float
+    reason: str
+
+    def seconds_left(self, now: float) -> float:
+        return max(0.0, self.at - now)
+
+
+def next_deadline(
+    now: float,
+    candidates: Mapping[str, float | None],
+    max_idle_seconds: float,
+) -> Deadline:
+    """Earliest candidate due time; ``None`` candidates have nothing scheduled.
+
+    ``max_idle_seconds`` caps the sleep so a missed event or clock jump is
+    picked up on the next pass.
+    """
+    deadline = Deadline(now + max_idle_seconds, "idle")
+    for reason, at in candidates.items():
+        if at is not None and at < deadline.at:
+            deadline = Deadline(max(now, at), reason)
+    return deadline
@@ -0,0 +1,37 @@
+"""Bulk canvas writes for the LED board: shared solid tiles and precomputed icon bitmaps."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Sequence
+
+from PIL import Image
+
+Box = tuple[int, int, int, int]  # x, y, width, height
+RGB = tuple[int, int, int]
+BLACK: RGB = (0, 0, 0)
+
+
+@lru_cache(maxsize=256)
+def solid(width: int, height: int, color: RGB = BLACK) -> Image.Image:
+    """A shared single-color RGB tile."""
+    return Image.new("RGB", (width, height), color)
+
+
+class Bitmap:
+    """A 0/1 icon pattern precomputed as a Pillow mask, with colored tiles cached."""
+
+    def __init__(self, rows: Sequence[Sequence[int]]):
+        self.size = (len(rows[0]), len(rows))
+        self.mask = Image.new("L", self.size)
+        self.mask.putdata([255 if bit else 0 for row in rows for bit in row])
+        self._tiles: dict[RGB, Image.Image] = {}
+
+    def tile(self, color: RGB) -> Image.Image:
+        """The icon in ``color`` on black, ready for ``SetImage``."""
+        tile = self._tiles.get(color)
+        if tile is None:
+            tile = solid(*self.size).copy()
+            tile.paste(color, (0, 0), self.mask)
+            self._tiles[color] = tile
+        return tile
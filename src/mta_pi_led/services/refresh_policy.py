@@ -0,0 +1,192 @@
+"""Adaptive refresh interval for the board's station feed worker."""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Collection, Mapping
+
+# Next displayed train this close (seconds) refreshes at the minimum interval.
+IMMINENT_ARRIVAL_SECONDS = 120
+# Nothing due within this window (overnight, suspended lines) backs off to the maximum.
+DISTANT_ARRIVAL_SECONDS = 15 * 60
+# An arrival moved by more than this between refreshes counts as changed.
+CHANGED_ARRIVAL_SECONDS = 60
+VOLATILE_CHANGE_RATIO = 0.3
+STABLE_CHANGE_RATIO = 0.05
+STABLE_BACKOFF_FACTOR = 1.5
+
+StationPayloads = Mapping[str, Mapping[str, Any]]
+ArrivalKey = tuple[str, str, str]
+ViewKey = tuple[str, str]  # station id, route id
+
+
+@dataclass(frozen=True)
+class RefreshBounds:
+    """Configured refresh interval and the adaptive limits around it."""
+
+    base_seconds: float
+    min_seconds: float
+    max_seconds: float
+
+    def clamp(self, seconds: float) -> float:
+        return min(self.max_seconds, max(self.min_seconds, seconds))
+
+
+def next_refresh_interval(
+    bounds: RefreshBounds,
+    previous_seconds: float,
+    seconds_to_next_arrival: float | None,
+    change_ratio: float | None,
+    arrivals_known: bool = True,
+) -> float:
+    """Pick the next interval from arrival proximity and last refresh volatility.
+
+    With no arrivals and ``arrivals_known`` false (errors, missing feeds), the
+    schedule is unknown rather than empty, so polling stays at the base interval.
+    """
+    if seconds_to_next_arrival is None and not arrivals_known:
+        interval = bounds.base_seconds
+    elif seconds_to_next_arrival is None or seconds_to_next_arrival > DISTANT_ARRIVAL_SECONDS:
+        interval = bounds.max_seconds
+    elif seconds_to_next_arrival <= IMMINENT_ARRIVAL_SECONDS:
+        interval = bounds.min_seconds
+    elif change_ratio is not None and change_ratio >= VOLATILE_CHANGE_RATIO:
+        interval = bounds.base_seconds / 2
+    elif change_ratio is not None and change_ratio <= STABLE_CHANGE_RATIO:
+        interval = max(previous_seconds, bounds.base_seconds) * STABLE_BACKOFF_FACTOR
+    else:
+        interval = bounds.base_seconds
+
+    if seconds_to_next_arrival is not None and seconds_to_next_arrival > IMMINENT_ARRIVAL_SECONDS:
+        # Be back by the time the next train turns imminent.
+        interval = min(interval, seconds_to_next_arrival - IMMINENT_ARRIVAL_SECONDS)
+    return bounds.clamp(interval)
+
+
+def _arrivals_by_key(payloads: StationPayloads, now: float) -> dict[ArrivalKey, list[int]]:
+    arrivals: dict[ArrivalKey, list[int]] = {}
+    for station_id, payload in payloads.items():
+        for route_id, route_data in (payload.get("trains") or {}).items():
+            for direction in ("uptown", "downtown"):
+                times = [
+                    arrival_time
+                    for arrival_time in route_data.get(direction, {}).get("arrival_times", [])
+                    if arrival_time > now
+                ]
+                if times:
+                    arrivals[(station_id, route_id, direction)] = times
+    return arrivals
+
+
+def arrivals_known(payloads: StationPayloads) -> bool:
+    """False when any payload is an error or lacks a feed, so missing trains prove nothing."""
+    return bool(payloads) and all(
+        payload.get("status") == "success" and not payload.get("missing_feeds")
+        for payload in payloads.values()
+    )
+
+
+def next_arrival_seconds(
+    payloads: StationPayloads,
+    now: float,
+    views: Collection[ViewKey] | None = None,
+) -> float | None:
+    """Seconds until the soonest upcoming arrival in ``views`` (every view when None)."""
+    soonest = min(
+        (
+            times[0]
+            for (station_id, route_id, _), times in _arrivals_by_key(payloads, now).items()
+            if views is None or (station_id, route_id) in views
+        ),
+        default=None,
+    )
+    return None if soonest is None else soonest - now
+
+
+def arrival_change_ratio(
+    previous: StationPayloads | None,
+    current: StationPayloads,
+    now: float,
+) -> float | None:
+    """Share of upcoming arrivals that appeared, vanished or moved since ``previous``.
+
+    Trains that simply departed are not counted as changes.
+    """
+    if previous is None:
+        return None
+    previous_arrivals = _arrivals_by_key(previous, now)
+    current_arrivals = _arrivals_by_key(current, now)
+
+    total = 0
+    changed = 0
+    for key in previous_arrivals.keys() | current_arrivals.keys():
+        before = previous_arrivals.get(key, [])
+        after = current_arrivals.get(key, [])
+        total += len(before) + len(after)
+        changed += sum(
+            1 for t in after if not any(abs(t - b) <= CHANGED_ARRIVAL_SECONDS for b in before)
+        )
+        changed += sum(
+            1 for b in before if not any(abs(t - b) <= CHANGED_ARRIVAL_SECONDS for t in after)
+        )
+    return changed / total if total else None
+
+
+class AdaptiveRefreshScheduler:
+    """Remember the last refresh and choose when the next one should run.
+
+    ``observe`` runs on the refresh worker after each fetch; ``interval_seconds``
+    is what the worker waits before fetching again. Arrival proximity only
+    considers ``displayed_views`` (what the board is showing), so a train
+    due at some other watched station does not pin the minimum interval.
+    """
+
+    def __init__(
+        self,
+        bounds: Callable[[], RefreshBounds],
+        displayed_views: Callable[[], Collection[ViewKey]] | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._bounds = bounds
+        self._displayed_views = displayed_views
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._previous: StationPayloads | None = None
+        self._interval: float | None = None
+
+    def observe(self, payloads: StationPayloads) -> float:
+        now = self._clock()
+        bounds = self._bounds()
+        with self._lock:
+            previous = self._previous
+            previous_interval = self._interval or bounds.base_seconds
+        views = self._displayed_views() if self._displayed_views is not None else None
+        seconds_to_next_arrival = next_arrival_seconds(payloads, now, views)
+        if seconds_to_next_arrival is None and views:
+            # The displayed view has no trains, so the board is about to skip it.
+            seconds_to_next_arrival = next_arrival_seconds(payloads, now)
+        interval = next_refresh_interval(
+            bounds,
+            previous_interval,
+            seconds_to_next_arrival,
+            arrival_change_ratio(previous, payloads, now),
+            arrivals_known(payloads),
+        )
+        with self._lock:
+            self._previous = payloads
+            self._interval = interval
+        return interval
+
+    def interval_seconds(self) -> float:
+        bounds = self._bounds()
+        with self._lock:
+            interval = self._interval
+        return bounds.base_seconds if interval is None else bounds.clamp(interval)
+
+    def reset(self):
+        """Forget history, e.g. when the watched stations change."""
+        with self._lock:
+            self._previous = None
+            self._interval = None
@@ -0,0 +1,109 @@
+"""Redraw only the LED layout regions whose content changed."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable
+
+from PIL import Image
+
+from mta_pi_led.services.frame_cache import FrameCache
+from mta_pi_led.services.raster import Box, solid
+
+# Past this share of the panel, one full-frame blit is cheaper than region blits.
+FULL_REDRAW_AREA_RATIO = 0.5
+
+
+@dataclass(frozen=True)
+class Region:
+    """Desired content of one layout box; ``key`` identifies what ``render`` draws."""
+
+    box: Box
+    key: Hashable
+    render: Callable[[], Image.Image] = field(compare=False)
+
+
+class RegionRenderer:
+    """Keep a scene of named regions and blit only those that changed.
+
+    The matrix double-buffers: the canvas returned by ``SwapOnVSync`` still
+    holds the frame from ``buffers`` presents ago, so each present diffs the
+    scene against what that buffer holds rather than what is on screen.
+    """
+
+    def __init__(
+        self,
+        size: tuple[int, int],
+        tile_cache: FrameCache,
+        frame_cache: FrameCache,
+        buffers: int = 2,
+    ):
+        self.size = size
+        self.tile_cache = tile_cache
+        self.frame_cache = frame_cache
+        self._buffers = buffers
+        self._regions: dict[str, Region] = {}
+        self._history: deque[dict[str, tuple[Box, Hashable]]] = deque(maxlen=buffers)
+
+    def set_region(
+        self,
+        name: str,
+        box: Box,
+        key: Hashable,
+        render: Callable[[], Image.Image],
+    ):
+        self._regions[name] = Region(box, key, render)
+
+    def invalidate(self):
+        """Forget buffer contents, e.g. after drawing on the canvas directly."""
+        self._history.clear()
+
+    def tile(self, name: str) -> Image.Image:
+        region = self._regions[name]
+        return self.tile_cache.get_or_render((name, region.box, region.key), region.render)
+
+    def frame(self) -> Image.Image:
+        """The whole scene as one image, from the frame cache when seen before."""
+        frame_key = tuple(sorted(self._scene_keys().items()))
+        return self.frame_cache.get_or_render(frame_key, self._compose_frame)
+
+    def present(self, canvas: Any) -> int:
+        """Draw what changed onto the back-buffer ``canvas``; return the blit count."""
+        scene = self._scene_keys()
+        previous = self._history[0] if len(self._history) == self._buffers else None
+        self._history.append(scene)
+
+        if previous is None:
+            canvas.SetImage(self.frame(), 0, 0)
+            return 1
+
+        dirty = [name for name, content in scene.items() if previous.get(name) != content]
+        # Boxes a region moved out of, or that no region covers any more.
+        vacated = [
+            box
+            for name, (box, _) in previous.items()
+            if name not in scene or scene[name][0] != box
+        ]
+        dirty_area = sum(
+            box[2] * box[3] for box in vacated + [self._regions[name].box for name in dirty]
+        )
+        if dirty_area > FULL_REDRAW_AREA_RATIO * self.size[0] * self.size[1]:
+            canvas.SetImage(self.frame(), 0, 0)
+            return 1
+
+        for box in vacated:
+            canvas.SetImage(solid(box[2], box[3]), box[0], box[1])
+        for name in dirty:
+            box = self._regions[name].box
+            canvas.SetImage(self.tile(name), box[0], box[1])
+        return len(vacated) + len(dirty)
+
+    def _scene_keys(self) -> dict[str, tuple[Box, Hashable]]:
+        return {name: (region.box, region.key) for name, region in self._regions.items()}
+
+    def _compose_frame(self) -> Image.Image:
+        frame = Image.new("RGB", self.size)
+        for name, region in self._regions.items():
+            frame.paste(self.tile(name), region.box[:2])
+        return frame
@@ -1,4 +1,4 @@
-const CACHE_NAME = "mta-board-v2";
+const CACHE_NAME = "mta-board-v3";
 const SHELL_ASSETS = [
   "/",
   "/static/web_control.css",
@@ -31,6 +31,11 @@ self.addEventListener("activate", (event) => {
 self.addEventListener("fetch", (event) => {
   const url = new URL(event.request.url);
 
+  // Let the browser hold the event stream open directly
+  if (url.pathname === "/api/board/events") {
+    return;
+  }
+
   // Network-first for API calls — never cache API data
   if (url.pathname.startsWith("/api/")) {
     event.respondWith(
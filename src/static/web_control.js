@@ -15,6 +15,9 @@ const state = {
   autoSaveTimer: null,
   serverUrl: "",
   arrivalsPollHandle: null,
+  arrivalsUpdatedAt: null,
+  arrivalsByStation: {},
+  eventSource: null,
 };
 
 const elements = {};
@@ -162,7 +165,11 @@ async function initialize() {
     startStatusPolling();
     // Load arrivals after everything else is ready — the GTFS fetch can be slow
     // and blocks the single-threaded Flask server from handling other requests.
-    loadArrivals().then(() => startArrivalsPolling());
+    loadArrivals().then(() => {
+      startArrivalsPolling();
+      // Push updates replace both polling loops while the stream is open.
+      startEventStream();
+    });
   } catch (error) {
     showConnectionError();
     setFlash("error", `Failed to initialize controller: ${error.message}`);
@@ -453,21 +460,24 @@ function emptyItem(text) {
 
 async function refreshBoardStatus() {
   try {
-    const payload = await fetchJson("/api/board/status");
-    if (payload.status === "ok") {
-      elements.boardStatusSummary.textContent = "Board heartbeat available.";
-      elements.boardStatusJson.textContent = JSON.stringify(payload.board, null, 2);
-      return;
-    }
-    elements.boardStatusSummary.textContent =
-      payload.message || "Board heartbeat not available yet.";
-    elements.boardStatusJson.textContent = JSON.stringify(payload, null, 2);
+    renderBoardStatus(await fetchJson("/api/board/status"));
   } catch (error) {
     elements.boardStatusSummary.textContent = `Board status unavailable: ${error.message}`;
     elements.boardStatusJson.textContent = "";
   }
 }
 
+function renderBoardStatus(payload) {
+  if (payload.status === "ok") {
+    elements.boardStatusSummary.textContent = "Board heartbeat available.";
+    elements.boardStatusJson.textContent = JSON.stringify(payload.board, null, 2);
+    return;
+  }
+  elements.boardStatusSummary.textContent =
+    payload.message || "Board heartbeat not available yet.";
+  elements.boardStatusJson.textContent = JSON.stringify(payload, null, 2);
+}
+
 function startStatusPolling() {
   if (state.statusPollHandle) {
     window.clearInterval(state.statusPollHandle);
@@ -530,8 +540,16 @@ async function loadArrivals() {
   elements.refreshArrivals.disabled = true;
   try {
     const payload = await fetchJson("/api/board/arrivals");
+    // The server republishes the same snapshot until arrivals change.
+    if (payload.updated_at && payload.updated_at === state.arrivalsUpdatedAt) {
+      return;
+    }
     renderArrivals(payload);
+    state.arrivalsByStation = payload.arrivals || {};
+    state.arrivalsUpdatedAt = payload.updated_at || null;
   } catch (error) {
+    state.arrivalsUpdatedAt = null;
+    state.arrivalsByStation = {};
     elements.liveArrivals.innerHTML = '<div class="empty">Failed to load arrivals.</div>';
     elements.arrivalsUpdated.textContent = "";
   } finally {
@@ -559,7 +577,11 @@ function renderArrivals(payload) {
     const routeIds = Object.keys(routes);
 
     html += '<div class="arrival-card">';
-    html += '<div class="arrival-station-name">' + escapeHtml(station.station_name || stationId) + "</div>";
+    html += '<div class="arrival-station-name">' + escapeHtml(station.station_name || stationId);
+    if (station.data_age_seconds > 0) {
+      html += ' <span class="arrival-stale">(data ' + Math.round(station.data_age_seconds) + "s old)</span>";
+    }
+    html += "</div>";
 
     if (station.status === "error" || routeIds.length === 0) {
       html += '<div class="empty">No trains available.</div>';
@@ -633,3 +655,52 @@ function startArrivalsPolling() {
   }, state.refreshSeconds * 1000);
 }
 
+function stopPolling() {
+  window.clearInterval(state.statusPollHandle);
+  window.clearInterval(state.arrivalsPollHandle);
+  state.statusPollHandle = null;
+  state.arrivalsPollHandle = null;
+}
+
+function startEventStream() {
+  if (!window.EventSource || state.eventSource) {
+    return;
+  }
+  const source = new EventSource(apiUrl("/api/board/events"));
+  state.eventSource = source;
+
+  source.addEventListener("open", () => {
+    stopPolling();
+  });
+
+  source.addEventListener("error", () => {
+    // EventSource reconnects on its own; poll until it does.
+    if (!state.arrivalsPollHandle) {
+      startStatusPolling();
+      startArrivalsPolling();
+    }
+  });
+
+  source.addEventListener("status", (event) => {
+    renderBoardStatus(JSON.parse(event.data));
+  });
+
+  source.addEventListener("arrivals", (event) => {
+    applyArrivalsEvent(JSON.parse(event.data));
+  });
+}
+
+function applyArrivalsEvent(update) {
+  // Events carry only stations whose arrivals changed; keep the rest.
+  const previous = update.full ? {} : state.arrivalsByStation;
+  const arrivals = {};
+  for (const stationId of update.stations || []) {
+    const station = (update.changed || {})[stationId] || previous[stationId];
+    if (station) {
+      arrivals[stationId] = station;
+    }
+  }
+  state.arrivalsByStation = arrivals;
+  state.arrivalsUpdatedAt = update.updated_at || null;
+  renderArrivals({ arrivals, updated_at: update.updated_at });
+}
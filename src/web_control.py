@@ -4,13 +4,17 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+import json
 import os
-from typing import Any
+import time
+from typing import Any, Iterator
 
-from flask import Flask, jsonify, render_template, request
+from flask import Flask, Response, jsonify, render_template, request, stream_with_context
 from flask_cors import CORS
 
 from app import get_train_status_batch
+from mta_pi_led.logging_config import configure_logging
+from mta_pi_led.services.arrivals_snapshot import ArrivalsPublisher, diff_station_digests
 from mta_pi_led.services.board_control import (
     build_schedule_preview,
     list_stations,
@@ -24,6 +28,17 @@ app = Flask(__name__)
 CORS(app, resources={r"/api/*": {"origins": "*"}})
 
 
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+
+
+# One background refresh serves every polling client.
+ARRIVALS_PUBLISHER = ArrivalsPublisher(get_train_status_batch, now=_utc_now)
+# How often an event stream re-checks config and the board heartbeat file.
+EVENT_STREAM_CHECK_SECONDS = 2.0
+EVENT_STREAM_KEEPALIVE_SECONDS = 15.0
+
+
 @app.get("/")
 def index() -> Any:
     return render_template("web_control.html")
@@ -48,6 +63,7 @@ def api_index() -> Any:
                 "GET /api/board/arrivals",
                 "GET /api/board/schedule",
                 "GET /api/board/status",
+                "GET /api/board/events",
             ],
         }
     )
@@ -96,6 +112,12 @@ def update_board_config() -> Any:
 
     current_payload = load_config_payload()
     current_config, _, _ = normalize_config_payload(current_payload, strict=False)
+    # Keep refresh bounds the controller UI does not edit.
+    incoming = {
+        "min_refresh_seconds": current_config["min_refresh_seconds"],
+        "max_refresh_seconds": current_config["max_refresh_seconds"],
+        **incoming,
+    }
     normalized, errors, _ = normalize_config_payload(incoming, strict=True)
 
     expected_version = incoming.get("version")
@@ -153,34 +175,109 @@ def get_board_schedule() -> Any:
 
 @app.get("/api/board/arrivals")
 def get_board_arrivals() -> Any:
-    raw_payload = load_config_payload()
-    config, _, _ = normalize_config_payload(raw_payload, strict=False)
-    stations = config.get("stations", [])
+    stations, refresh_seconds = _arrivals_settings()
     if not stations:
         return jsonify({"arrivals": {}, "updated_at": _utc_now()})
-    arrivals = get_train_status_batch(stations)
-    return jsonify({"arrivals": arrivals, "updated_at": _utc_now()})
+
+    snapshot = ARRIVALS_PUBLISHER.current(stations, refresh_seconds)
+    if snapshot is None:
+        return jsonify({"status": "error", "error": "Arrivals are still loading"}), 503
+    response = app.response_class(snapshot.body, mimetype="application/json")
+    response.set_etag(snapshot.etag)
+    # Clients may cache but must revalidate; unchanged arrivals get a 304.
+    response.headers["Cache-Control"] = "no-cache"
+    return response.make_conditional(request)
 
 
 @app.get("/api/board/status")
 def get_board_status() -> Any:
+    return jsonify(_board_status_payload())
+
+
+@app.get("/api/board/events")
+def stream_board_events() -> Any:
+    """Server-Sent Events: `arrivals` diffs and `status` heartbeat changes."""
+    return Response(
+        stream_with_context(_board_events()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _arrivals_settings() -> tuple[list[str], int]:
+    raw_payload = load_config_payload()
+    config, _, _ = normalize_config_payload(raw_payload, strict=False)
+    return config.get("stations", []), config["refresh_seconds"]
+
+
+def _board_status_payload() -> dict[str, Any]:
     status = load_board_runtime_status()
     if status is None:
-        return jsonify(
-            {
-                "status": "unknown",
-                "message": "Board heartbeat not available yet.",
-                "updated_at": _utc_now(),
-            }
-        )
-    return jsonify({"status": "ok", "board": status, "updated_at": _utc_now()})
+        return {
+            "status": "unknown",
+            "message": "Board heartbeat not available yet.",
+            "updated_at": _utc_now(),
+        }
+    return {"status": "ok", "board": status, "updated_at": _utc_now()}
 
 
-def _utc_now() -> str:
-    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+def _sse(event: str, payload: dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(payload, separators=(',', ':'))}\n\n"
+
+
+def _board_events() -> Iterator[str]:
+    sent_digests: dict[str, str] | None = None
+    sent_etag: str | None = None
+    sent_status: Any = None
+    last_write = time.monotonic()
+    yield "retry: 5000\n\n"
+
+    while True:
+        stations, refresh_seconds = _arrivals_settings()
+        if stations:
+            snapshot = ARRIVALS_PUBLISHER.current(stations, refresh_seconds)
+            if snapshot is not None and snapshot.etag != sent_etag:
+                # First event carries every station; later ones only what changed.
+                changed = diff_station_digests(sent_digests or {}, snapshot)
+                yield _sse(
+                    "arrivals",
+                    {
+                        "full": sent_digests is None,
+                        "stations": list(snapshot.stations),
+                        "changed": changed,
+                        "updated_at": snapshot.updated_at,
+                    },
+                )
+                sent_digests = snapshot.station_digests
+                sent_etag = snapshot.etag
+                last_write = time.monotonic()
+        elif sent_etag != "":
+            yield _sse(
+                "arrivals",
+                {"full": True, "stations": [], "changed": {}, "updated_at": _utc_now()},
+            )
+            sent_digests, sent_etag = None, ""
+            last_write = time.monotonic()
+
+        status_payload = _board_status_payload()
+        status_key = (status_payload["status"], status_payload.get("board"))
+        if status_key != sent_status:
+            yield _sse("status", status_payload)
+            sent_status = status_key
+            last_write = time.monotonic()
+
+        if time.monotonic() - last_write >= EVENT_STREAM_KEEPALIVE_SECONDS:
+            yield ": keep-alive\n\n"
+            last_write = time.monotonic()
+
+        if stations:
+            ARRIVALS_PUBLISHER.wait_for_update(sent_etag, timeout=EVENT_STREAM_CHECK_SECONDS)
+        else:
+            time.sleep(EVENT_STREAM_CHECK_SECONDS)
 
 
 if __name__ == "__main__":
+    configure_logging()
     try:
         port = int(os.getenv("WEB_PORT", "8080"))
     except ValueError:
@@ -192,4 +289,6 @@ if __name__ == "__main__":
         port=port,
         debug=debug_enabled,
         use_reloader=reloader_enabled,
+        # Event streams hold a request thread each.
+        threaded=True,
     )